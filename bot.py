@@ -9,6 +9,7 @@ from discord.ext import commands
 from dotenv import load_dotenv
 
 from src.server.keep_alive import keep_alive
+from src.crawlers.http_client import HttpClient
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +22,9 @@ intents = discord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix='/', intents=intents)
 
+# 모든 크롤러가 공유하는 HTTP 클라이언트 (호스트별 keep-alive 커넥션 풀)
+bot.http_client = HttpClient()
+
 class RateLimitHandler:
     """Discord Rate Limit 지수 백오프 처리"""
     
@@ -241,6 +245,7 @@ async def shutdown(signal_received, loop):
     print("📡 Discord 연결을 종료하는 중...")
     if not bot.is_closed():
         await bot.close()
+    await bot.http_client.close()
     print("✅ 봇이 안전하게 종료되었습니다.")
     loop.stop()
 
@@ -316,6 +321,10 @@ async def main():
     except NotImplementedError:
         print("⚠️ Windows 환경: Signal handlers 건너뜀")
     
+    # 업스트림 호스트 연결 예열 (DNS 캐시 + keep-alive 커넥션)
+    print("🌐 HTTP 커넥션 풀 예열 시작...")
+    await bot.http_client.warm_up()
+
     # Cog 로드
     print("📂 Cog 로드 시작...")
     await load_cogs()
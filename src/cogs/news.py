@@ -1,13 +1,64 @@
+import io
+import json
 import discord
 import pytz
+import time
 import asyncio
 from typing import List, Dict, Any, Callable
 
 from discord.ext import commands, tasks
 from datetime import date, datetime, timedelta
 
-from crawlers.news_crawling import lol_news_articles, valorant_news_articles, overwatch_news_articles
-from db import load_all_channel_state, load_channel_state, save_channel_state, delete_channel_state, load_state, update_state
+from crawlers.news_crawling import (
+    lol_news_articles, valorant_news_articles, overwatch_news_articles, fetch_news_since, fetch_news_day, today_kst, KST, FEED_STATS
+)
+from crawlers.poll_scheduler import PollScheduler, fetch_match_start_times
+from delivery import NewsFanout, SubscriptionIndex, article_key, batch_embeds, news_embed_cache, render_news_embed, render_news_page_embed
+from db import (
+    load_all_channel_state, load_channel_state, save_channel_state, save_channel_batch_mode, delete_channel_state,
+    export_guild_channel_states, import_guild_channel_states, news_state, delivery_ledger, warm_channel_cache,
+    ensure_pool, get_pool_metrics, save_articles, load_articles, mark_archive_days, load_archive_days
+)
+
+# 게임별 뉴스 크롤링 함수와 로그용 게임 이름
+NEWS_FEEDS = {
+    "lol": (lol_news_articles, "롤"),
+    "valorant": (valorant_news_articles, "발로란트"),
+    "overwatch": (overwatch_news_articles, "오버워치"),
+}
+
+# 뉴스 루프가 폴링 스케줄을 확인하는 주기 (초). 실제 게임별 폴링 간격은 PollScheduler가 정함
+POLL_TICK = 60
+
+# 경기 일정(경기 시작 시각) 갱신 주기 (초)
+MATCH_TIMES_REFRESH = 6 * 3600
+
+# 피드 하나를 기다리는 최대 시간 (초, 밀린 기사를 여러 페이지 따라잡는 시간 포함)
+FEED_TIMEOUT = 30
+
+# /뉴스확인으로 한 번에 조회할 수 있는 최대 기간 (일)
+MAX_LOOKUP_DAYS = 31
+
+# 아카이브에 없는 지난 날짜를 크롤링할 때의 동시 요청 수
+ARCHIVE_FILL_CONCURRENCY = 4
+
+def parse_news_date(date_str: str, today: date):
+    """
+    /뉴스확인 날짜 인자를 date로 바꿉니다. (오늘/어제, YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD)
+
+    Returns:
+        date | None: 형식이 올바르지 않으면 None
+    """
+    if not date_str or date_str.lower() == "오늘":
+        return today
+    if date_str.lower() == "어제":
+        return today - timedelta(days=1)
+    for format in ["%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"]:
+        try:
+            return datetime.strptime(date_str, format).date()
+        except ValueError:
+            continue
+    return None
 
 async def safe_send(ctx_or_channel, content=None, **kwargs):
     """Rate Limit 안전한 메시지 전송"""
@@ -46,32 +97,7 @@ class NewsView(discord.ui.View):
     def get_embeds(self):
         embeds = [self.info_embed]
         for article in self.get_page_articles():
-            embed = discord.Embed(
-                title=article.get('title'),
-                url=article.get('linkUrl'),
-                color=0x1E90FF
-            )
-            if article.get('thumbnail'):
-                embed.set_thumbnail(url=article['thumbnail'])
-            ts = article.get('createdAt')
-            if ts:
-                dt = datetime.fromtimestamp(ts / 1000)
-                # 한국식 시간 포맷
-                kst = pytz.timezone("Asia/Seoul")
-                dt_kst = dt.astimezone(kst)
-                hour = dt_kst.hour
-                minute = dt_kst.minute
-                ampm = "오전" if hour < 12 else "오후"
-                hour12 = hour if 1 <= hour <= 12 else (hour - 12 if hour > 12 else 12)
-                formatted = f"{dt_kst.strftime('%Y-%m-%d')} {ampm} {hour12}:{minute:02d}"
-            else:
-                formatted = "-"
-            embed.add_field(
-                name="⏰ 발행시간",
-                value=formatted,
-                inline=False
-            )
-            embeds.append(embed)
+            embeds.append(news_embed_cache.get("page", article, render_news_page_embed))
         return embeds
 
     class PrevPageButton(discord.ui.Button):
@@ -110,11 +136,26 @@ class NewsCommand(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.channel_games = {}
+        self.fanout = NewsFanout()
+        self.subscriptions = SubscriptionIndex()
+        self.poll_scheduler = PollScheduler(NEWS_FEEDS.keys())
 
     async def cog_load(self):
+        # DB 풀을 미리 만들고(min_size개 연결) 헬스 체크까지 끝내 둠 → 첫 명령어가 풀 생성을 기다리지 않음
+        try:
+            await ensure_pool()
+        except Exception as e:
+            print(f"⚠️ DB 풀 생성 실패 (첫 DB 요청에서 다시 시도): {e}")
+
+        # 채널 설정 캐시를 미리 로드 (이후 뉴스 루프/설정 조회는 DB 왕복 없이 캐시 사용)
+        try:
+            channel_count = await warm_channel_cache()
+            print(f"📡 채널 설정 캐시 로드 완료 ({channel_count}개 채널)")
+        except Exception as e:
+            print(f"⚠️ 채널 설정 캐시 로드 실패 (첫 뉴스 루프에서 다시 시도): {e}")
+
         # 뉴스 루프는 봇 연결 완료 후 on_ready에서 시작
         print("📰 뉴스 시스템 로드 완료 (루프는 봇 연결 후 시작)")
-        pass
 
     async def cog_unload(self):
         if self.news_loop.is_running():
@@ -122,92 +163,137 @@ class NewsCommand(commands.Cog):
             print("❌ 뉴스 자동 전송 루프 중지됨")
 
     def create_news_embed(self, article: Dict[str, Any]):
-        embed = discord.Embed(
-            title=article.get('title'),
-            description=article.get('subContent'),
-            url=article.get('linkUrl'),
-            timestamp=datetime.fromtimestamp(article["createdAt"] / 1000, tz=pytz.UTC),
-            color=0x1E90FF
-        )
-
-        if article['thumbnail']:
-            embed.set_thumbnail(url=article['thumbnail'])
-
-        ts_seconds = article['createdAt'] / 1000
-        kst = pytz.timezone("Asia/Seoul")
-        dt = datetime.fromtimestamp(ts_seconds, tz=kst)
-
-        formatted = dt.strftime("%Y-%m-%d %H:%M:%S")
-        
-        embed.add_field(
-            name="⏰ 발행시간", 
-            value=formatted,
-            inline=False
-        )
-
-        return embed
+        """기사 임베드를 렌더 캐시에서 가져옵니다. (같은 기사는 모든 채널이 한 번 만든 임베드를 공유)"""
+        return news_embed_cache.get("news", article, render_news_embed)
     
-    @tasks.loop(seconds=1200)
+    def build_news_messages(self, articles: List[Dict[str, Any]], batch_mode: bool):
+        """
+        기사 목록으로 channel.send에 전달할 메시지 목록과, 메시지별로 담긴 기사 목록을 만듭니다.
+        묶음 전송이면 최대 10개 임베드를 한 메시지로 묶습니다.
+        """
+        embeds = [self.create_news_embed(article) for article in articles]
+        if not batch_mode:
+            return [{"embed": embed} for embed in embeds], [[article] for article in articles]
+
+        messages, message_articles, start = [], [], 0
+        for batch in batch_embeds(embeds):
+            messages.append({"embeds": batch})
+            message_articles.append(articles[start:start + len(batch)])
+            start += len(batch)
+        return messages, message_articles
+
+    @tasks.loop(seconds=POLL_TICK)
     async def news_loop(self):
         if not self.bot.is_ready():
             return
         try:
-            formatted_date = date.today().strftime('%Y-%m-%d')
+            # 0. 구독 인덱스를 갱신하고, 폴링 시각이 된(구독자가 있는) 게임만 고름
+            self.subscriptions.rebuild(await load_all_channel_state())
+            await self.refresh_match_times()
+            due_games = self.poll_scheduler.due_games(
+                {game: self.subscriptions.subscriber_count(game) for game in NEWS_FEEDS}
+            )
+            if not due_games:
+                return
 
-            state = await load_state()
-            lol_last = state.get("lol", 0)
-            valorant_last = state.get("valorant", 0)
-            overwatch_last = state.get("overwatch", 0)
+            # 보관 기간이 지난 기사의 임베드는 렌더 캐시에서 제거
+            news_embed_cache.evict()
 
-            # 1. 각 게임별로 lastProcessedAt 이후의 기사만 추출
-            fetch_lol_articles = [article for article in await self.safe_fetch_news(lol_news_articles, formatted_date, "롤") if article["createdAt"] > lol_last]
-            fetch_valorant_articles = [article for article in await self.safe_fetch_news(valorant_news_articles, formatted_date, "발로란트") if article["createdAt"] > valorant_last]
-            fetch_overwatch_articles = [article for article in await self.safe_fetch_news(overwatch_news_articles, formatted_date, "오버워치") if article["createdAt"] > overwatch_last]
+            state = await news_state.load()
+            if not news_state.loaded:
+                # 워터마크 없이 크롤링하면 오늘 기사 전체를 모든 채널에 다시 보내게 되므로 이번 사이클은 건너뜀
+                print("⚠️ 뉴스 상태(lastProcessedAt)를 불러오지 못해 이번 사이클을 건너뜁니다.")
+                return
+
+            # 1. 폴링할 게임 피드를 동시에, lastProcessedAt에 도달할 때까지 페이지 단위로 수집
+            crawled = await self.crawl_new_articles(state, due_games)
+            for game in due_games:
+                self.poll_scheduler.record(game, crawled[game])
+            # 수집한 기사는 /뉴스확인 조회용 아카이브에도 저장
+            await save_articles(crawled)
+
+            fetch_lol_articles = crawled["lol"]
+            fetch_valorant_articles = crawled["valorant"]
+            fetch_overwatch_articles = crawled["overwatch"]
             
             # 2. 뉴스가 없으면 종료
             if not (fetch_lol_articles or fetch_valorant_articles or fetch_overwatch_articles):
+                # 이전 사이클에 기록하지 못한 lastProcessedAt이 있으면 다시 기록
+                await news_state.commit()
                 return
             
-            # 3. 뉴스 전송
-            for channel_id, game_states in (await load_all_channel_state()).items():
-                articles_to_send = []
-                
-                if game_states.get("lol", False):
-                    articles_to_send.extend(fetch_lol_articles)
-                if game_states.get("valorant", False):
-                    articles_to_send.extend(fetch_valorant_articles)
-                if game_states.get("overwatch", False):
-                    articles_to_send.extend(fetch_overwatch_articles)
-
-                if not articles_to_send:
-                    continue
-                
-                articles_to_send.sort(key=lambda x: x['createdAt'])
-
-                channel = self.bot.get_channel(channel_id)
-                if channel:
-                    for i, article in enumerate(articles_to_send):
-                        embed = self.create_news_embed(article)
-                        await safe_send(channel, embed=embed)
-                        
-                        # 마지막 뉴스가 아니면 5초 대기
-                        if i < len(articles_to_send) - 1:
-                            await asyncio.sleep(5)
-
-            # 4. 각 게임별로 전송한 뉴스가 있다면, 가장 최신 createdAt만 update_state로 갱신
-            if fetch_lol_articles:
-                await update_state("lol", [max(fetch_lol_articles, key=lambda x: x["createdAt"])])
-            if fetch_valorant_articles:
-                await update_state("valorant", [max(fetch_valorant_articles, key=lambda x: x["createdAt"])])
-            if fetch_overwatch_articles:
-                await update_state("overwatch", [max(fetch_overwatch_articles, key=lambda x: x["createdAt"])])
+            # 3. 뉴스 전송 (구독 조합별로 기사 병합/임베드 생성을 한 번만 하고, 같은 조합의 채널이 공유)
+            merged = self.subscriptions.merged_articles({
+                "lol": fetch_lol_articles,
+                "valorant": fetch_valorant_articles,
+                "overwatch": fetch_overwatch_articles,
+            })
+
+            # 이전에 중단된 사이클에서 이미 보낸 (채널, 기사)는 전송 기록으로 걸러 빠진 것만 전송
+            delivered = await delivery_ledger.delivered(
+                [article_key(article) for articles in merged.values() for article in articles]
+            )
+
+            jobs = []
+            job_articles = {}
+            for combo, articles_to_send in merged.items():
+                shared_messages = {}
+                for channel_id in self.subscriptions.channels(combo):
+                    channel = self.bot.get_channel(channel_id)
+                    if not channel:
+                        continue
+                    batch_mode = self.subscriptions.states[channel_id].get("batch_mode", False)
+                    pending = [article for article in articles_to_send if (channel_id, article_key(article)) not in delivered]
+                    if not pending:
+                        continue
+
+                    if len(pending) == len(articles_to_send):
+                        if batch_mode not in shared_messages:
+                            shared_messages[batch_mode] = self.build_news_messages(articles_to_send, batch_mode)
+                        messages, message_articles = shared_messages[batch_mode]
+                    else:
+                        messages, message_articles = self.build_news_messages(pending, batch_mode)
+                    jobs.append((channel, messages))
+                    job_articles[channel_id] = message_articles
+
+            async def record_sent(channel, index: int):
+                await delivery_ledger.record(
+                    channel.id, [(article_key(article), article["createdAt"]) for article in job_articles[channel.id][index]]
+                )
+
+            report = await self.fanout.deliver(jobs, on_sent=record_sent)
+            await delivery_ledger.flush()
+
+            # 4. 각 게임별로 전송한 뉴스의 가장 최신 createdAt을 모아, 한 트랜잭션으로 lastProcessedAt 갱신
+            for game, articles in crawled.items():
+                news_state.stage(game, articles)
+            if not await news_state.commit():
+                print("⚠️ lastProcessedAt 기록 실패 → 다음 사이클에 다시 기록합니다.")
 
             now_done = datetime.now(pytz.timezone("Asia/Seoul")).strftime("%Y-%m-%d %H:%M:%S")
-            print(f"✅ [{now_done}] 뉴스 전송 완료")
+            print(
+                f"✅ [{now_done}] 뉴스 전송 완료 "
+                f"(채널 {report['channels']}개, 메시지 {report['sent']}건, 실패 {report['failed']}건, 소요 {report['elapsed']:.2f}초)"
+            )
+            print(
+                f"📊 누적 피드 요청: 새 응답 {FEED_STATS['fetched']}건, 304 {FEED_STATS['not_modified']}건, "
+                f"본문 동일 {FEED_STATS['unchanged']}건, 변경 없는 폴링 {FEED_STATS['noop']}건"
+            )
+            pool_stats = get_pool_metrics()
+            print(
+                f"🗄️ DB 풀: 사용 중 {pool_stats['in_use']}개 (최대 {pool_stats['in_use_max']}개), "
+                f"획득 대기 평균 {pool_stats['acquire_wait_avg'] * 1000:.1f}ms / 최대 {pool_stats['acquire_wait_max'] * 1000:.1f}ms, "
+                f"획득 타임아웃 {pool_stats['acquire_timeouts']}건"
+            )
+            for query in pool_stats["slow_queries"]:
+                print(f"   ⏱️ {query['count']}회, 평균 {query['avg'] * 1000:.1f}ms, 최대 {query['max'] * 1000:.1f}ms: {query['sql']}")
             
         except Exception as e:
             now_error = datetime.now(pytz.timezone("Asia/Seoul")).strftime("%Y-%m-%d %H:%M:%S")
             print(f"❌ [{now_error}] 뉴스 루프 실행 중 오류: {e}")
+        finally:
+            # 중단(연결 끊김으로 인한 루프 취소 등)되더라도 지금까지 보낸 기록은 남김
+            await delivery_ledger.flush()
 
     @commands.command(
     name='뉴스확인',
@@ -218,42 +304,42 @@ class NewsCommand(commands.Cog):
         "└ `/뉴스확인 어제` : 어제 뉴스를 확인합니다.\n\n"
         "**📅 날짜로 검색**\n"
         "└ `/뉴스확인 2025-07-14` : 해당 날짜의 뉴스를 확인합니다.\n"
-        "└ `/뉴스확인 2025.07.14` 또는 `/뉴스확인 2025/07/14` 형식도 지원합니다.\n\n"
+        "└ `/뉴스확인 2025.07.14` 또는 `/뉴스확인 2025/07/14` 형식도 지원합니다.\n"
+        "└ `/뉴스확인 2025-07-01 2025-07-07` : 기간(최대 31일)의 뉴스를 확인합니다.\n\n"
         "**ℹ️ 안내**\n"
         "- 오늘 이후의 날짜를 입력하거나, 잘못된 날짜 형식 입력 시 안내 메시지가 출력됩니다.\n"
         "- 뉴스가 없을 경우에도 안내 메시지가 출력됩니다.\n"
         "- 뉴스가 여러 개일 경우, 한 페이지에 4개씩 페이지네이션으로 보여집니다."
     )
 )
-    async def check_news_now(self, ctx: commands.Context, date_str: str = None):
-        if not date_str:
-            target_date = date.today()
-        elif date_str.lower() == "오늘":
-            target_date = date.today()
-        elif date_str.lower() == "어제":
-            target_date = date.today() - timedelta(days=1)
-        else:
-            for format in ["%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"]:
-                try:
-                    target_date = datetime.strptime(date_str, format).date()
-                    if target_date > date.today():
-                        await safe_send(ctx, "❌ 날짜가 오늘 이후일 수 없습니다.\n\n자세한 사용법은 `/뉴스확인` 명령어를 참고해주세요!")
-                        return
-                    break
-                except ValueError:
-                    continue
-
-        if not target_date:
+    async def check_news_now(self, ctx: commands.Context, date_str: str = None, end_date_str: str = None):
+        today = today_kst()
+        start_date = parse_news_date(date_str, today)
+        end_date = parse_news_date(end_date_str, today) if end_date_str else start_date
+
+        if not start_date or not end_date:
             await safe_send(ctx, "❌ 날짜 형식이 올바르지 않습니다. \n 예시: `/뉴스확인 2025-07-14`\n\n자세한 사용법은 `/뉴스확인` 명령어를 참고해주세요!")
             return
 
+        if start_date > end_date:
+            start_date, end_date = end_date, start_date
+
+        # 순서를 맞춘 뒤 확인해야 (미래 날짜, 과거 날짜) 순서로 입력한 기간도 걸러짐
+        if end_date > today:
+            await safe_send(ctx, "❌ 날짜가 오늘 이후일 수 없습니다.\n\n자세한 사용법은 `/뉴스확인` 명령어를 참고해주세요!")
+            return
+        if (end_date - start_date).days >= MAX_LOOKUP_DAYS:
+            await safe_send(ctx, f"❌ 기간은 최대 {MAX_LOOKUP_DAYS}일까지 조회할 수 있습니다.\n\n자세한 사용법은 `/뉴스확인` 명령어를 참고해주세요!")
+            return
+
         try:
             articles_to_send = []
-            formatted_date = target_date.strftime('%Y-%m-%d')
+            formatted_date = start_date.strftime('%Y-%m-%d')
+            if end_date != start_date:
+                formatted_date += f" ~ {end_date.strftime('%Y-%m-%d')}"
 
-            articles_to_send.extend(await self.safe_fetch_news(lol_news_articles, formatted_date, "롤"))
-            articles_to_send.extend(await self.safe_fetch_news(valorant_news_articles, formatted_date, "발로란트"))
-            articles_to_send.extend(await self.safe_fetch_news(overwatch_news_articles, formatted_date, "오버워치"))
+            for articles in (await self.lookup_news(start_date, end_date)).values():
+                articles_to_send.extend(articles)
 
             articles_to_send.sort(key=lambda x: x['createdAt'], reverse=True)
 
@@ -287,7 +373,8 @@ class NewsCommand(commands.Cog):
             '**게임별 설정:** `/뉴스채널설정 롤 발로란트 오버워치`\n'
             '**전체 설정:** `/뉴스채널설정 모든게임` 또는 `/뉴스채널설정 모두`\n'
             '**설정 해제:** `/뉴스채널설정 해제` 또는 `/뉴스채널설정 삭제`\n'
-            '**설정 확인:** `/뉴스채널설정` (인자 없이)\n\n'
+            '**설정 확인:** `/뉴스채널설정` (인자 없이)\n'
+            '**전송 방식:** `/뉴스채널설정 묶음` (최대 10개씩 한 메시지) 또는 `/뉴스채널설정 개별`\n\n'
             '💡 **전체 설정 키워드:** 모든게임, 모두, 전체, ON, on\n'
             '💡 **해제 키워드:** 해제, 삭제, off, OFF'
         )
@@ -317,9 +404,10 @@ class NewsCommand(commands.Cog):
         if not games:
             loaded_games = await load_channel_state(ctx.channel.id)
             
-            current_games = [game_names[game] for game, enabled in loaded_games.items() if enabled]
+            current_games = [game_names[game] for game, enabled in loaded_games.items() if game in game_names and enabled]
             if current_games:
-                await safe_send(ctx, f"현재 '{ctx.channel.name}' 채널에 설정된 뉴스 설정값: -> {', '.join(current_games)}")
+                send_mode = "묶음" if loaded_games.get("batch_mode") else "개별"
+                await safe_send(ctx, f"현재 '{ctx.channel.name}' 채널에 설정된 뉴스 설정값: -> {', '.join(current_games)} (전송 방식: {send_mode})")
             else:
                 await safe_send(ctx, "현재 채널은 뉴스 설정이 되어 있지 않습니다.\n`/뉴스채널설정 롤 발로란트 오버워치`과 같은 명령어로 설정해주세요!")
             return
@@ -332,6 +420,15 @@ class NewsCommand(commands.Cog):
                 await safe_send(ctx, f"ℹ️ '{ctx.channel.name}' 채널은 이미 뉴스 알림 설정이 되어 있지 않습니다.")
             return
 
+        if len(games) == 1 and games[0] in ("묶음", "개별"):
+            batch_mode = games[0] == "묶음"
+            updated = await save_channel_batch_mode(ctx.channel.id, batch_mode)
+            if updated:
+                await safe_send(ctx, f"✅ '{ctx.channel.name}' 채널의 뉴스 전송 방식이 '{games[0]}' 전송으로 변경되었습니다.")
+            else:
+                await safe_send(ctx, f"ℹ️ '{ctx.channel.name}' 채널은 뉴스 알림 설정이 되어 있지 않습니다.\n먼저 `/뉴스채널설정 롤 발로란트 오버워치`와 같이 게임을 설정해주세요!")
+            return
+
         selected_games = []
         for game in games:
             mapped = game_mapping.get(game.lower())
@@ -362,30 +459,234 @@ class NewsCommand(commands.Cog):
             
             embed = discord.Embed(
                 title="📰 뉴스 채널 설정 완료",
-                description=f"**채널:** {ctx.channel.name}\n**게임:** {', '.join(selected_names)}\n\n🔄 20분마다 자동으로 새로운 뉴스를 확인합니다.",
+                description=f"**채널:** {ctx.channel.name}\n**게임:** {', '.join(selected_names)}\n\n🔄 뉴스가 올라오는 빈도에 맞춰 5~30분마다 자동으로 새로운 뉴스를 확인합니다.",
                 color=0x00ff00
             )
             
             await safe_send(ctx, embed=embed)
 
-    async def safe_fetch_news(self, game_func: Callable, formatted_date: str, game_name: str):
+    @commands.command(
+        name='뉴스설정내보내기',
+        help='이 서버의 채널별 뉴스 설정을 JSON 파일로 내보냅니다.'
+    )
+    @commands.guild_only()
+    @commands.has_guild_permissions(manage_channels=True)
+    async def export_news_settings(self, ctx: commands.Context):
+        channel_ids = [channel.id for channel in ctx.guild.text_channels]
+        states = await export_guild_channel_states(channel_ids)
+        if not states:
+            await safe_send(ctx, "ℹ️ 이 서버에는 뉴스 알림이 설정된 채널이 없습니다.")
+            return
+
+        payload = {
+            "guild_id": ctx.guild.id,
+            "channels": {
+                str(channel_id): {key: value for key, value in state.items() if key != "channel_id"}
+                for channel_id, state in states.items()
+            },
+        }
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        await safe_send(
+            ctx,
+            f"✅ {len(states)}개 채널의 뉴스 설정을 내보냈습니다.\n`/뉴스설정가져오기`에 이 파일을 첨부하면 그대로 복원됩니다.",
+            file=discord.File(io.BytesIO(data), filename=f"news_settings_{ctx.guild.id}.json")
+        )
+
+    @commands.command(
+        name='뉴스설정가져오기',
+        help='내보낸 JSON 파일을 첨부하면 이 서버의 뉴스 설정을 한 번에 복원합니다.'
+    )
+    @commands.guild_only()
+    @commands.has_guild_permissions(manage_channels=True)
+    async def import_news_settings(self, ctx: commands.Context):
+        if not ctx.message.attachments:
+            await safe_send(ctx, "❌ `/뉴스설정내보내기`로 받은 JSON 파일을 첨부해주세요.")
+            return
+
+        try:
+            payload = json.loads(await ctx.message.attachments[0].read())
+            channels = payload["channels"]
+            imported = {
+                int(channel_id): {game: bool(state.get(game, False)) for game in ("lol", "valorant", "overwatch", "batch_mode")}
+                for channel_id, state in channels.items()
+            }
+        except (ValueError, KeyError, AttributeError, TypeError, discord.HTTPException):
+            await safe_send(ctx, "❌ 설정 파일 형식이 올바르지 않습니다.")
+            return
+
+        # 이 서버에 있는 채널만 가져온다.
+        channel_ids = [channel.id for channel in ctx.guild.text_channels]
+        guild_channel_ids = set(channel_ids)
+        states = {channel_id: state for channel_id, state in imported.items() if channel_id in guild_channel_ids}
+        skipped = len(imported) - len(states)
+
+        if not await import_guild_channel_states(channel_ids, states):
+            await safe_send(ctx, "❌ 뉴스 설정 복원 중 오류가 발생했습니다.\n봇 관리자에게 문의해주세요.")
+            return
+
+        message = f"✅ {len(states)}개 채널의 뉴스 설정을 복원했습니다."
+        if skipped:
+            message += f"\nℹ️ 이 서버에 없는 채널 {skipped}개는 건너뛰었습니다."
+        await safe_send(ctx, message)
+
+    async def lookup_news(self, start_date: date, end_date: date) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        [start_date, end_date] 기간(KST)의 뉴스를 게임별로 반환합니다.
+        지난 날짜는 아카이브에서 읽고(아직 아카이브하지 않은 날짜만 한 번 크롤링), 오늘 날짜만 크롤러로 새로 가져옵니다.
+
+        Returns:
+            dict: 게임 key별 뉴스 데이터 리스트
+        """
+        today = today_kst()
+        found = {game: {} for game in NEWS_FEEDS}
+
+        past_end = min(end_date, today - timedelta(days=1))
+        if start_date <= past_end:
+            unsaved = await self.fill_archive(start_date, past_end)
+            start_ms = int(datetime(start_date.year, start_date.month, start_date.day, tzinfo=KST).timestamp() * 1000)
+            end_day = past_end + timedelta(days=1)
+            end_ms = int(datetime(end_day.year, end_day.month, end_day.day, tzinfo=KST).timestamp() * 1000)
+            archived = await load_articles(list(NEWS_FEEDS), start_ms, end_ms)
+            for source in (archived, unsaved):
+                for game, articles in source.items():
+                    found[game].update((article_key(article), article) for article in articles)
+
+        if end_date >= today:
+            live = await self.crawl_news(today.strftime('%Y-%m-%d'))
+            await save_articles(live)
+            for game, articles in live.items():
+                found[game].update((article_key(article), article) for article in articles)
+
+        return {game: list(articles.values()) for game, articles in found.items()}
+
+    async def fill_archive(self, start_date: date, end_date: date) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        [start_date, end_date] 기간 중 아직 아카이브하지 않은 (게임, 날짜)만 크롤링해 아카이브에 저장합니다.
+        요청에 성공한 날짜만 완료로 기록하므로, 실패한 날짜는 다음 조회 때 다시 크롤링합니다.
+
+        Returns:
+            dict: 아카이브 저장에 실패해 직접 반환하는 게임 key별 기사 (저장에 성공하면 빈 dict)
+        """
+        archived_days = await load_archive_days(list(NEWS_FEEDS), start_date, end_date)
+        missing = [
+            (game, start_date + timedelta(days=offset))
+            for offset in range((end_date - start_date).days + 1)
+            for game in NEWS_FEEDS
+            if (game, start_date + timedelta(days=offset)) not in archived_days
+        ]
+        if not missing:
+            return {}
+
+        session = self.bot.http_client.session("naver")
+        semaphore = asyncio.Semaphore(ARCHIVE_FILL_CONCURRENCY)
+
+        async def fetch(game: str, day: date):
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(fetch_news_day(game, day.strftime('%Y-%m-%d'), session), timeout=FEED_TIMEOUT)
+                except Exception as e:
+                    print(f"⚠️ {NEWS_FEEDS[game][1]} {day} 뉴스 아카이브 실패: {e}")
+                    return None
+
+        results = await asyncio.gather(*(fetch(game, day) for game, day in missing))
+
+        fetched = {game: [] for game in NEWS_FEEDS}
+        completed_days = []
+        for (game, day), articles in zip(missing, results):
+            if articles is None:
+                continue
+            fetched[game].extend(articles)
+            completed_days.append((game, day))
+
+        if await save_articles(fetched):
+            await mark_archive_days(completed_days)
+            return {}
+        return fetched
+
+    async def crawl_news(self, formatted_date: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        모든 게임의 뉴스 피드를 동시에 크롤링합니다.
+        피드마다 FEED_TIMEOUT 제한을 두어, 느리거나 실패한 피드는 빈 리스트로 처리하고
+        나머지 피드의 결과는 그대로 반환합니다.
+
+        Args:
+            formatted_date: 뉴스 크롤링 함수에 전달할 날짜 문자열
+
+        Returns:
+            dict: 게임 key("lol", "valorant", "overwatch")별 뉴스 데이터 리스트
+        """
+        session = self.bot.http_client.session("naver")
+        results = await asyncio.gather(*(
+            self.safe_fetch_news(game_func, game_name, formatted_date, session=session, timeout=FEED_TIMEOUT)
+            for game_func, game_name in NEWS_FEEDS.values()
+        ))
+        return dict(zip(NEWS_FEEDS.keys(), results))
+
+    async def crawl_new_articles(self, state: Dict[str, int], games: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        지정한 게임들의 lastProcessedAt 이후 기사를 동시에 수집합니다. (fetch_news_since 사용)
+        실패하거나 시간 초과된 게임은 빈 리스트가 되어 이번 사이클에 워터마크가 갱신되지 않습니다.
+
+        Args:
+            state: 게임 key별 lastProcessedAt
+            games: 이번 사이클에 폴링할 게임 key 목록
+
+        Returns:
+            dict: 게임 key별 신규 기사 리스트 (폴링하지 않은 게임은 빈 리스트)
+        """
+        session = self.bot.http_client.session("naver")
+        results = await asyncio.gather(*(
+            self.safe_fetch_news(
+                fetch_news_since, NEWS_FEEDS[game][1], game, self.poll_scheduler.watermark(game, state.get(game, 0)),
+                session=session, timeout=FEED_TIMEOUT
+            )
+            for game in games
+        ))
+        crawled = {game: [] for game in NEWS_FEEDS}
+        crawled.update(zip(games, results))
+        return crawled
+
+    async def refresh_match_times(self):
+        """경기 시작 시각을 MATCH_TIMES_REFRESH 주기로 다시 가져와 폴링 스케줄러에 반영합니다."""
+        if time.time() - self.poll_scheduler.match_times_updated_at < MATCH_TIMES_REFRESH:
+            return
+        try:
+            match_times = await asyncio.wait_for(
+                fetch_match_start_times(
+                    self.bot.http_client.session("naver"),
+                    self.bot.http_client.session("opgg"),
+                ),
+                timeout=FEED_TIMEOUT
+            )
+            self.poll_scheduler.set_match_times(match_times)
+            print(f"📅 경기 일정 갱신: 롤 {len(match_times['lol'])}경기, 발로란트 {len(match_times['valorant'])}경기")
+        except Exception as e:
+            # 실패해도 다음 주기까지는 재시도하지 않음 (기존 일정 유지)
+            self.poll_scheduler.match_times_updated_at = time.time()
+            print(f"⚠️ 경기 일정 갱신 실패: {e}")
+
+    async def safe_fetch_news(self, game_func: Callable, game_name: str, *args, timeout: float = None, **kwargs):
         """
         뉴스 크롤링 함수를 실행하고, 뉴스 데이터를 반환합니다.
-        뉴스 데이터가 없으면 빈 리스트를 반환합니다.
+        뉴스 데이터가 없거나 timeout 안에 응답이 없으면 빈 리스트를 반환합니다.
 
         Args:
             game_func: 뉴스 크롤링 함수
-            formatted_date: 뉴스 크롤링 함수에 전달할 날짜 문자열
-            game_name: 뉴스 크롤링 함수에 전달할 게임 이름
+            game_name: 로그에 표시할 게임 이름
+            *args, **kwargs: 뉴스 크롤링 함수에 전달할 인자
+            timeout: 최대 대기 시간 (초). None이면 제한 없음
 
         Returns:
             list: 뉴스 데이터 리스트
         """
         try:
-            news_data = await game_func(formatted_date)
+            news_data = await asyncio.wait_for(game_func(*args, **kwargs), timeout=timeout)
             if news_data and isinstance(news_data, list):
                 return news_data
             return []
+        except asyncio.TimeoutError:
+            print(f"⏰ {game_name} 뉴스 크롤링 시간 초과 ({timeout}초)")
+            return []
         except Exception as e:
             print(f"{game_name} 뉴스 크롤링 오류: {e}")
             return []
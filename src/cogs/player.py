@@ -177,7 +177,7 @@ class PlayerButton(discord.ui.Button):
                 player_link = self.player_data.get('player_link')
                 
                 # 선수 상세 정보 가져오기
-                player_info = await fetch_valorant_player_info(player_name, real_name, player_link)
+                player_info = await fetch_valorant_player_info(player_name, real_name, player_link, session=interaction.client.http_client.session("vlr"))
                 
                 # player_info가 비어있거나 None인 경우 처리
                 if not player_info:
@@ -1,16 +1,38 @@
-import ssl
 from typing import List
-from zoneinfo import ZoneInfo
-import certifi
 from discord.ext import commands, tasks
-from crawlers.schedule_crawling import fetch_lol_league_schedule_months, fetch_monthly_lol_league_schedule, fetch_valorant_league_schedule, parse_lol_month_days
-from datetime import datetime, timezone
+from crawlers.schedule_crawling import LOL_LEAGUE_TYPE, VALORANT_LEAGUE_TYPE, fetch_upcoming_lol_matches, fetch_valorant_league_schedule
+from crawlers.schedule_cache import schedule_cache
+from crawlers.news_crawling import KST, today_kst
+from datetime import datetime
 import discord
 import io
-import aiohttp
-from PIL import Image, ImageDraw, ImageFont
+import time
 import asyncio
+import heapq
 import traceback
+from rendering import build_schedule_sheet, load_score_font
+from delivery import LiveScoreTracker
+
+# /리그에서 보여주는 다가오는 경기 수
+UPCOMING_LIMIT = 4
+
+# 미리 가져올 (게임, 리그 코드) 목록 = 버튼으로 조회할 수 있는 모든 리그
+SCHEDULE_LEAGUES = [("lol", code) for code in LOL_LEAGUE_TYPE.values()] + [("valorant", code) for code in VALORANT_LEAGUE_TYPE.values()]
+
+# 일정 프리페치 루프가 리그별 갱신 시각을 확인하는 주기 (초)
+PREFETCH_TICK = 60
+
+# 리그별 일정 프리페치 간격 (초). 일정 캐시의 stale_ttl(15분)보다 짧아 버튼 응답은 항상 캐시에서 처리됨
+PREFETCH_INTERVAL = 10 * 60
+
+# 오늘(KST) 경기가 있거나 진행 중인 리그, 또는 직전 프리페치가 실패한 리그의 프리페치 간격 (초)
+PREFETCH_MATCH_DAY_INTERVAL = 2 * 60
+
+# 프리페치 동시 요청 리그 수
+PREFETCH_CONCURRENCY = 4
+
+# 진행 중인 경기가 있는 리그의 점수 폴링 주기 (초)
+LIVE_POLL_TICK = 60
 
 async def safe_send(ctx_or_channel, content=None, **kwargs):
     """Rate Limit 안전한 메시지 전송"""
@@ -23,27 +45,6 @@ async def safe_send(ctx_or_channel, content=None, **kwargs):
         print(f"메시지 전송 실패: {e}")
         return None
 
-LOL_LEAGUE_TYPE = {
-    "LCK": "lck",
-    "LPL": "lpl",
-    "LEC": "lec",
-    "LCS": "lcs",
-    "MSI": "msi",
-    "WORLDS": "wrl",
-    "LJL": "ljl",
-    "EWC": "ewc_lol"
-}
-
-VALORANT_LEAGUE_TYPE = {
-    "VCT BR": "brazil",
-    "VCT JP": "japan",
-    "VCT NA": "na",
-    "VCT Pacific": "pacific",
-    "VCT Americas": "americas",
-    "VCT EMEA": "emea",
-    "Valorant Masters":  "masters",
-}
-
 class LeagueButton(discord.ui.Button):
     def __init__(self, game_name: str, league_name: str, league_code: str, cog: "ScheduleCommand"):
         super().__init__(label=league_name, style=discord.ButtonStyle.primary)
@@ -63,7 +64,7 @@ class LeagueButton(discord.ui.Button):
                     return
                 
                 # 임베드 생성 및 전송
-                await self.cog.send_upcoming_embeds(interaction.channel, upcoming)
+                await self.cog.send_upcoming_embeds(interaction.channel, upcoming, league=("lol", self.league_code))
 
             except Exception as e:
                 print(f"{self.game_name} {self.league_name} 리그 명령어 실행 중 오류: {e}")
@@ -78,7 +79,7 @@ class LeagueButton(discord.ui.Button):
                     await safe_send(interaction.channel, f"❌ 예정된 {self.game_name} {self.league_name} 경기를 찾을 수 없습니다.")
                     return
                 
-                await self.cog.send_upcoming_embeds(interaction.channel, upcoming)
+                await self.cog.send_upcoming_embeds(interaction.channel, upcoming, league=("valorant", self.league_code))
 
             except Exception as e:
                 print(f"{self.game_name} {self.league_name} 리그 명령어 실행 중 오류: {e}")
@@ -117,205 +118,223 @@ class LeagueView(discord.ui.View):
 class ScheduleCommand(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.load_verify_locations(certifi.where())
-        self.connector = aiohttp.TCPConnector(
-            ssl=self.ssl_context,
-            limit=4,
-            ttl_dns_cache=300,
-            force_close=True
-        )
-        self.timeout = aiohttp.ClientTimeout(total=15)
-        self.session = None
-    
+        self.score_font = None
+        # (게임, 리그 코드) → 다음 프리페치 시각 (monotonic)
+        self.next_prefetch_at = {}
+        self.prefetch_semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+        # 진행 중인 경기가 담긴 일정 메시지 (점수가 바뀌면 새로 보내지 않고 그 메시지를 수정)
+        self.live_scores = LiveScoreTracker()
+
     async def cog_load(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                connector=self.connector,
-                timeout=self.timeout,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.22 Safari/537.36",
-                    "Accept": "image/avif,image/webp,image/*,*/*;q=0.8"
-                }
-            )
+        # 점수 폰트는 한 번만 로드해 모든 스코어보드가 재사용
+        self.score_font = await asyncio.to_thread(load_score_font)
+        # 일정/로고/일정 시트를 백그라운드에서 미리 채워 버튼 응답이 업스트림을 기다리지 않게 함
+        self.schedule_prefetch_loop.start()
+        self.live_score_loop.start()
 
     async def cog_unload(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
-
-    async def send_upcoming_embeds(self, channel: discord.TextChannel, upcoming: List[dict]):
-        # 이미지 배너 생성 및 Embed 전송
-        async def build_scoreboard(team1: dict, team2: dict, score1, score2):
-            """팀 로고와 점수를 조합한 PNG BytesIO 반환"""
+        if self.schedule_prefetch_loop.is_running():
+            self.schedule_prefetch_loop.cancel()
+        if self.live_score_loop.is_running():
+            self.live_score_loop.cancel()
+
+    def match_status_line(self, m: dict) -> str:
+        """경기 시작 시각과 진행 상태 한 줄 (예: <t:...:F> | 진행중)"""
+        start_epoch = int(datetime.fromisoformat(m["startDate"]).timestamp())
+        date_abs = f"<t:{start_epoch}:F>"
+
+        if m["status"] == "BEFORE":
+            return date_abs
+        elif m["status"] == "STARTED":
+            return f"{date_abs} | 진행중"
+        else:
+            return f"{date_abs} | 종료"
+
+    def build_schedule_embed(self, upcoming: List[dict]) -> discord.Embed:
+        """다가오는 경기 목록 임베드 (경기마다 필드 하나, 순서는 일정 시트 이미지와 같음)"""
+        if any(m["status"] == "STARTED" for m in upcoming):
+            colour = discord.Colour.orange()
+        elif all(m["status"] not in ("BEFORE", "STARTED") for m in upcoming):
+            colour = discord.Colour.green()
+        else:
+            colour = discord.Colour.blue()
+
+        embed = discord.Embed(title="📅 다가오는 경기 일정", colour=colour)
+        for i, m in enumerate(upcoming, start=1):
+            embed.add_field(name=f"{i}. {m['team1']} vs {m['team2']}", value=self.match_status_line(m), inline=False)
+        return embed
+
+    async def render_schedule_message(self, upcoming: List[dict]) -> dict:
+        """일정 메시지 내용(임베드 + 일정 시트 이미지)을 만듭니다. 전송/수정 모두 이 결과를 사용합니다."""
+        embed = self.build_schedule_embed(upcoming)
+
+        try:
+            data = await build_schedule_sheet(upcoming, self.bot.http_client.session(), self.score_font)
+        except Exception as e:
+            print(f"이미지 생성 실패: {e}")
+            data = None
+
+        if not data:
+            return {"embed": embed}
+        embed.set_image(url="attachment://schedule.png")
+        return {"embed": embed, "file": discord.File(io.BytesIO(data), filename="schedule.png")}
+
+    async def send_upcoming_embeds(self, channel: discord.TextChannel, upcoming: List[dict], league: tuple = None):
+        # 모든 경기를 한 장의 일정 시트 이미지로 그려, 임베드 하나와 함께 메시지 한 건으로 전송
+        try:
+            content = await self.render_schedule_message(upcoming)
+        except Exception as e:
+            print(f"임베드 생성 실패: {e}")
+            print(f"[ERROR] 예외 발생 시 경기 데이터: {upcoming}")
+            traceback.print_exc()
+            return None
+
+        message = await safe_send(channel, **content)
+        # 진행 중인 경기가 있으면 점수 추적 대상으로 등록 (live_score_loop가 점수 변경 시 이 메시지를 수정)
+        if message and league:
+            self.live_scores.track(league, message, upcoming)
+        return message
+
+    async def edit_schedule_message(self, message: discord.Message, matches: List[dict]) -> bool:
+        """점수가 바뀐 일정 메시지의 임베드와 일정 시트 이미지를 제자리에서 교체합니다."""
+        try:
+            content = await self.render_schedule_message(matches)
+            file = content.pop("file", None)
+            await message.edit(**content, attachments=[file] if file else [])
+            return True
+        except discord.NotFound:
+            # 삭제된 메시지는 더 추적하지 않음
+            self.live_scores.untrack(message.id)
+            return False
+        except Exception as e:
+            print(f"일정 메시지 수정 실패: {e}")
+            return False
+
+    async def load_lol_schedule(self, league_code: str) -> List[dict]:
+        """롤 리그의 다가오는 4경기를 업스트림에서 가져옵니다. (월 목록은 캐시, 월별 일정은 동시에 요청, 실패 시 None → 캐시하지 않음)"""
+        return await fetch_upcoming_lol_matches(league_code, limit=UPCOMING_LIMIT, session=self.bot.http_client.session("naver"))
+
+    async def load_valorant_schedule(self, league_code: str) -> List[dict]:
+        """발로란트 리그의 다가오는 4경기를 업스트림에서 가져옵니다. (실패 시 None → 캐시하지 않음)"""
+        matches = await fetch_valorant_league_schedule(league_code, session=self.bot.http_client.session("opgg"))
+        if matches is None:
+            return None
+        return heapq.nsmallest(UPCOMING_LIMIT, matches, key=lambda m: m["startDate"])
+
+    def schedule_loader(self, game: str, league_code: str):
+        """일정 캐시에 넘길 (게임, 리그)의 업스트림 로더"""
+        if game == "lol":
+            return lambda: self.load_lol_schedule(league_code)
+        return lambda: self.load_valorant_schedule(league_code)
+
+    def is_match_day(self, upcoming: List[dict]) -> bool:
+        """진행 중인 경기가 있거나 오늘(KST) 시작하는 경기가 있는지 확인합니다."""
+        today = today_kst()
+        for m in upcoming:
+            if m["status"] == "STARTED":
+                return True
             try:
-                async def fetch_img(url):
-                    for attempt in range(3):
-                        try:
-                            await asyncio.sleep(0.3 * attempt)
-                            async with self.session.get(url) as resp:
-                                if resp.status == 200:
-                                    data = await resp.read()
-                                    return Image.open(io.BytesIO(data)).convert("RGBA")
-                                raise ValueError(f"HTTP {resp.status}")
-                        except Exception as e:
-                            if attempt == 2:
-                                raise e
-                            print(f"이미지 다운로드 재시도 {attempt + 1}/3: {e}")
-
-                img1 = await fetch_img(team1["img"])
-                await asyncio.sleep(0.2)
-                img2 = await fetch_img(team2["img"])
-
-                # 로고 사이즈 조정
-                size = (70, 70)
-                img1.thumbnail(size, Image.LANCZOS)
-                img2.thumbnail(size, Image.LANCZOS)
-
-                # 캔버스 생성
-                W, H = 460, 90
-                canvas = Image.new("RGBA", (W, H), (255, 255, 255, 0))
-                draw = ImageDraw.Draw(canvas)
-
-                y = (H - img1.height)//2
-                canvas.paste(img1, (10, y), img1)
-                canvas.paste(img2, (W - img2.width - 10, y), img2)
-
-                try:
-                    font = ImageFont.truetype("DejaVuSans-Bold.ttf", 32)
-                except Exception:
-                    try:
-                        # 시스템 폰트 경로들을 시도
-                        font_paths = [
-                            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
-                            "/System/Library/Fonts/Arial.ttf",  # macOS
-                            "C:/Windows/Fonts/arial.ttf",  # Windows
-                            "/usr/share/fonts/TTF/arial.ttf",  # Some Linux distributions
-                        ]
-                        font = None
-                        for font_path in font_paths:
-                            try:
-                                font = ImageFont.truetype(font_path, 32)
-                                break
-                            except:
-                                continue
-                        if font is None:
-                            raise Exception("No suitable font found")
-                    except Exception:
-                        font = ImageFont.load_default()
-
-                if score1 is None and score2 is None:
-                    score_text = "- : -"
-                else:
-                    left_score = 0 if score1 is None else score1
-                    right_score = 0 if score2 is None else score2
-                    score_text = f"{left_score} : {right_score}"
-                
-                try:
-                    tw, th = draw.textsize(score_text, font=font)
-                except AttributeError:
-                    bbox = draw.textbbox((0, 0), score_text, font=font)
-                    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-                
-                draw.text(((W - tw)//2, (H - th)//2), score_text, fill="white", font=font, stroke_width=2, stroke_fill="black")
-
-                buf = io.BytesIO()
-                canvas.save(buf, format="PNG")
-                buf.seek(0)
-                return buf
+                if datetime.fromisoformat(m["startDate"]).astimezone(KST).date() == today:
+                    return True
+            except (TypeError, ValueError):
+                continue
+        return False
+
+    async def prefetch_league(self, game: str, league_code: str) -> bool:
+        """
+        리그 일정을 다시 가져와 일정 캐시를 갱신하고, 같은 경기 목록의 일정 시트(팀 로고 포함)를 미리 렌더링합니다.
+        다음 프리페치 시각은 경기일이면 PREFETCH_MATCH_DAY_INTERVAL, 아니면 PREFETCH_INTERVAL 뒤로 잡습니다.
+
+        Returns:
+            bool: 성공 여부 (실패하면 PREFETCH_MATCH_DAY_INTERVAL 뒤에 다시 시도)
+        """
+        key = (game, league_code)
+        async with self.prefetch_semaphore:
+            try:
+                # 버튼 요청과 같은 single-flight 작업을 공유 (루프가 취소돼도 기다리던 요청에는 영향 없음)
+                upcoming = await asyncio.shield(schedule_cache.refresh(key, self.schedule_loader(game, league_code)))
+                # 로더가 None을 반환하면 업스트림 조회 실패 (빈 리스트는 예정된 경기 없음)
+                if upcoming is None:
+                    raise RuntimeError("업스트림 일정 조회 실패")
+                if upcoming:
+                    await build_schedule_sheet(upcoming, self.bot.http_client.session(), self.score_font)
             except Exception as e:
-                print(f"이미지 생성 실패: {e}")
-                return None
+                print(f"⚠️ {game} {league_code} 일정 프리페치 실패: {e}")
+                self.next_prefetch_at[key] = time.monotonic() + PREFETCH_MATCH_DAY_INTERVAL
+                return False
+
+        match_day = self.is_match_day(upcoming)
+        interval = PREFETCH_MATCH_DAY_INTERVAL if match_day else PREFETCH_INTERVAL
+        self.next_prefetch_at[key] = time.monotonic() + interval
+        return True
+
+    @tasks.loop(seconds=PREFETCH_TICK)
+    async def schedule_prefetch_loop(self):
+        now = time.monotonic()
+        due = [league for league in SCHEDULE_LEAGUES if now >= self.next_prefetch_at.get(league, 0)]
+        if not due:
+            return
 
-        # Discord 메시지 전송 (safe_send 사용)
-        for i, m in enumerate(upcoming):
-            try:
-                start_epoch = int(datetime.fromisoformat(m["startDate"]).timestamp())
-                date_abs = f"<t:{start_epoch}:F>"
-
-                title = f"{m['team1']} vs {m['team2']}"
-
-                if m["status"] == "BEFORE":
-                    desc_lines = [date_abs]
-                    colour = discord.Colour.blue()
-                elif m["status"] == "STARTED":
-                    desc_lines = [f"{date_abs} | 진행중"]
-                    colour = discord.Colour.orange()
-                else:
-                    desc_lines = [f"{date_abs} | 종료"]
-                    colour = discord.Colour.green()
-
-                embed = discord.Embed(title=title, description="\n".join(desc_lines), colour=colour)
-
-                if m.get("team1Img") and m.get("team2Img"):
-                    buf = await build_scoreboard({"img": m["team1Img"]}, {"img": m["team2Img"]}, m.get("score1"), m.get("score2"))
-                    if buf:
-                        file = discord.File(buf, filename="score.png")
-                        embed.set_image(url="attachment://score.png")
-                        await safe_send(channel, file=file, embed=embed)
-                    else:
-                        await safe_send(channel, embed=embed)
-                else:
-                    await safe_send(channel, embed=embed)
-
-                # 메시지 전송 간격 (Discord Rate Limit 방지)
-                if i < len(upcoming) - 1:
-                    await asyncio.sleep(1)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(self.prefetch_league(game, code) for game, code in due))
+        print(
+            f"📅 일정 프리페치 완료: {sum(results)}/{len(due)}개 리그 "
+            f"({time.perf_counter() - started:.1f}초, 캐시 {schedule_cache.stats})"
+        )
 
-            except Exception as e:
-                print(f"임베드 생성/전송 실패: {e}")
-                print(f"[ERROR] 예외 발생 시 경기 데이터: {m}")
-                traceback.print_exc()
+    @schedule_prefetch_loop.before_loop
+    async def before_schedule_prefetch(self):
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(seconds=LIVE_POLL_TICK)
+    async def live_score_loop(self):
+        # 추적 중인 메시지가 있는 (진행 중인 경기가 있는) 리그만 폴링
+        leagues = self.live_scores.leagues()
+        if not leagues:
+            return
+
+        async def poll(league):
+            # 일정 캐시를 갱신하는 single-flight 작업을 공유하므로 버튼 응답도 최신 점수를 받음
+            fresh = await asyncio.shield(schedule_cache.refresh(league, self.schedule_loader(*league)))
+            return league, fresh
+
+        results = await asyncio.gather(*(poll(league) for league in leagues), return_exceptions=True)
+        edits = []
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"⚠️ 진행 중인 경기 점수 조회 실패: {result}")
+                continue
+            league, fresh = result
+            if fresh is None:
                 continue
+            for message, matches in self.live_scores.changes(league, fresh):
+                edits.append(self.edit_schedule_message(message, matches))
+
+        if edits:
+            edited = await asyncio.gather(*edits)
+            print(f"🔴 점수 변경 반영: 메시지 {sum(edited)}/{len(edits)}개 수정 (추적 중 {len(self.live_scores)}개)")
+
+    @live_score_loop.before_loop
+    async def before_live_score(self):
+        await self.bot.wait_until_ready()
 
     async def get_lol_league_schedule(self, ctx: commands.Context, league_code: str) -> List[dict]:
-        now_dt = datetime.now(timezone.utc)
-        today_iso = now_dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-        today_kst = now_dt.astimezone(ZoneInfo("Asia/Seoul")).replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-        now_ym = now_dt.strftime("%Y-%m")
-
-        # 월 목록 조회
-        year_str = now_dt.strftime("%Y")
-        months_resp = await fetch_lol_league_schedule_months(year_str, league_code)
-        months_list: list[str] = (months_resp or {}).get("content", [])
-        months_list = [m for m in months_list if m >= now_ym]
-
-        upcoming: list[dict] = []
-
-        # 월별 일정 수집
-        for i, ym in enumerate(months_list):
-            if i > 0:
-                await asyncio.sleep(1)
-                
-            print(f"월 일정 조회: {ym}")
-            month_resp = await fetch_monthly_lol_league_schedule(ym, league_code)
-            if not month_resp:
-                continue
-            for match in parse_lol_month_days(month_resp):
-                if match["startDate"] and match["startDate"] >= today_iso:
-                    upcoming.append(match)
-            if len(upcoming) >= 4:
-                break
+        # 같은 리그를 동시에 조회하면 요청은 한 번만, 짧은 시간 안의 재조회는 캐시에서
+        upcoming = await schedule_cache.get(("lol", league_code), self.schedule_loader("lol", league_code))
 
         if not upcoming:
             await safe_send(ctx, "❌ 예정된 롤 경기를 찾을 수 없습니다.")
             return
 
-        upcoming.sort(key=lambda m: m["startDate"])
-        upcoming = upcoming[:4]
-
         print(f"경기 {len(upcoming)}개 발견, 임베드 생성 시작")
 
         return upcoming
     
     async def get_valorant_league_schedule(self, ctx: commands.Context, league_code: str) -> List[dict]:
-        upcoming = await fetch_valorant_league_schedule(league_code)
+        upcoming = await schedule_cache.get(("valorant", league_code), self.schedule_loader("valorant", league_code))
         if not upcoming:
             await safe_send(ctx, "❌ 예정된 발로란트 경기를 찾을 수 없습니다.")
             return
-        
-        upcoming.sort(key=lambda m: m["startDate"])
-        upcoming = upcoming[:4]
 
         print(f"경기 {len(upcoming)}개 발견, 임베드 생성 시작")
         
@@ -382,6 +401,4 @@ class ScheduleCommand(commands.Cog):
 
 async def setup(bot: commands.Bot):
     cog = ScheduleCommand(bot)
-    await bot.add_cog(cog)
-    if hasattr(cog, 'cog_load'):
-        await cog.cog_load()
\ No newline at end of file
+    await bot.add_cog(cog)
\ No newline at end of file
@@ -0,0 +1,102 @@
+import ssl
+import asyncio
+import aiohttp
+import certifi
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+# 크롤러가 접속하는 업스트림 호스트 (세션 이름 → 기본 URL)
+UPSTREAM_HOSTS = {
+    "naver": "https://esports-api.game.naver.com",
+    "opgg": "https://esports.op.gg",
+    "vlr": "https://www.vlr.gg",
+    "fandom": "https://lol.fandom.com",
+}
+
+# 업스트림 외의 호스트(팀 로고 CDN 등)에 사용하는 세션 이름
+DEFAULT_SESSION = "default"
+
+
+class HttpClient:
+    """
+    봇이 소유하는 공용 HTTP 클라이언트.
+    업스트림 호스트마다 keep-alive 커넥션 풀과 DNS 캐시를 가진 ClientSession을 하나씩 유지하여,
+    반복 요청이 TCP 연결 / TLS 핸드셰이크 / DNS 조회를 다시 하지 않고 소켓을 재사용하도록 한다.
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = 8,
+        keepalive_timeout: float = 60,
+        ttl_dns_cache: int = 300,
+        timeout: float = 15,
+    ):
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+        self.sessions: dict[str, aiohttp.ClientSession] = {}
+
+    def session(self, name: str = DEFAULT_SESSION) -> aiohttp.ClientSession:
+        """
+        이름에 해당하는 세션을 반환한다. 아직 없으면 새 커넥션 풀과 함께 생성한다.
+        (ClientSession은 이벤트 루프 안에서 생성되어야 하므로 코루틴 안에서 호출해야 한다.)
+
+        Args:
+            name (str): UPSTREAM_HOSTS의 key 또는 DEFAULT_SESSION
+
+        Returns:
+            aiohttp.ClientSession: 해당 호스트 전용 세션
+        """
+        session = self.sessions.get(name)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=self.ssl_context,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self.sessions[name] = session
+        return session
+
+    async def warm_up(self):
+        """모든 업스트림 호스트에 HEAD 요청을 보내 DNS 캐시와 keep-alive 연결을 미리 채운다."""
+        async def _warm(name: str, base_url: str):
+            try:
+                async with self.session(name).head(base_url, allow_redirects=False) as response:
+                    await response.release()
+                return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"⚠️ {name} 연결 예열 실패: {e}")
+                return False
+
+        results = await asyncio.gather(*(_warm(name, url) for name, url in UPSTREAM_HOSTS.items()))
+        print(f"✅ HTTP 커넥션 풀 예열 완료 ({sum(results)}/{len(results)}개 호스트)")
+
+    async def close(self):
+        """모든 세션과 커넥션 풀을 닫는다."""
+        for session in self.sessions.values():
+            if not session.closed:
+                await session.close()
+        self.sessions.clear()
+
+
+@asynccontextmanager
+async def session_scope(session: Optional[aiohttp.ClientSession] = None, **kwargs) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    주입받은 세션이 있으면 그대로 사용하고, 없으면 요청 한 번을 위한 임시 세션을 만든다.
+    (단독 실행 스크립트처럼 HttpClient가 없는 환경을 위한 대체 경로)
+
+    Args:
+        session (aiohttp.ClientSession | None): 공용 HttpClient에서 받은 세션
+        **kwargs: 임시 세션 생성 시 ClientSession에 전달할 인자
+    """
+    if session is not None:
+        yield session
+        return
+
+    async with aiohttp.ClientSession(**kwargs) as temp_session:
+        yield temp_session
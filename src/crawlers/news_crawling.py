@@ -1,122 +1,262 @@
 import aiohttp
 import asyncio
+import hashlib
 import heapq
+import orjson
 
-from typing import List, Dict, Any
-from datetime import date
+from typing import List, Dict, Any, Optional
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
 
+from crawlers.http_client import session_scope
 
-async def lol_news_articles(formatted_date: str) -> List[Dict[str, Any]]:
+
+NEWS_LIST_URL = 'https://esports-api.game.naver.com/service/v1/news/list'
+
+NEWS_HEADERS = {
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.15 Safari/537.36'
+}
+
+NEWS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# 페이지 하나에 요청하는 기사 수
+NEWS_PAGE_SIZE = 20
+
+# 날짜 하나에서 요청할 최대 페이지 수 (무한 페이지네이션 방지)
+MAX_NEWS_PAGES = 10
+
+# 증분 수집 시 거슬러 올라갈 최대 일수 (오래 멈춰 있던 경우 전체 기록을 다시 긁지 않도록 제한)
+MAX_CATCHUP_DAYS = 2
+
+# 조건부 요청 캐시에 보관할 최대 페이지 수
+MAX_FEED_CACHE = 256
+
+# (newsType, 날짜, 페이지) → 마지막 응답의 ETag / Last-Modified / 본문 해시 / 디코딩된 기사 목록
+_feed_cache: Dict[tuple, Dict[str, Any]] = {}
+
+# 피드 요청 통계 (304 응답 / 본문 해시 동일 / 새로 디코딩 / 변경 없어 바로 끝난 증분 수집)
+FEED_STATS = {"not_modified": 0, "unchanged": 0, "fetched": 0, "noop": 0}
+
+# 네이버 뉴스의 'day' 파라미터는 한국 시간 기준
+KST = ZoneInfo("Asia/Seoul")
+
+
+def today_kst() -> date:
+    """한국 시간 기준 오늘 날짜를 반환합니다. (서버 시간대와 무관)"""
+    return datetime.now(KST).date()
+
+
+async def _request_news_page(news_type: str, formatted_date: str, page: int, session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
     """
-    주어진 날짜의 네이버 e스포츠(롤) 뉴스 목록을 비동기로 가져옵니다.
+    네이버 e스포츠 뉴스 목록 API의 한 페이지를 요청합니다. (최신순)
+
+    이전에 받은 응답이 있으면 ETag / Last-Modified 조건부 헤더를 보내고, 304 응답이거나
+    (조건부 요청을 지원하지 않는 경우) 본문 해시가 같으면 JSON 디코딩 없이 이전 결과를 재사용합니다.
+    요청 실패 시 예외를 그대로 전달합니다.
 
     Args:
+        news_type (str): 네이버 API의 newsType 값 (lol / valorant / overwatch)
         formatted_date (str): 'YYYY-MM-DD' 형식의 날짜 문자열
+        page (int): 1부터 시작하는 페이지 번호
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용
 
     Returns:
-        List[Dict]: 해당 날짜의 신규 뉴스 기사 목록 (lastProcessedAt 이후 기사만 반환)
+        Dict: content(기사 목록), newest(가장 최근 createdAt), changed(이전 응답과 달라졌는지)
     """
-    url = f'https://esports-api.game.naver.com/service/v1/news/list?sort=latest&newsType=lol&day={formatted_date}&page=1&pageSize=20'
-
     params = {
+        'sort': 'latest',
+        'newsType': news_type,
+        'day': formatted_date,
+        'page': page,
+        'pageSize': NEWS_PAGE_SIZE,
         'access-control-allow-credentials': 'true',
         'access-control-allow-origin': 'https://game.naver.com'
     }
 
-    headers = {
-        'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.15 Safari/537.36'
+    cache_key = (news_type, formatted_date, page)
+    cached = _feed_cache.get(cache_key)
+
+    headers = dict(NEWS_HEADERS)
+    if cached and cached["etag"]:
+        headers['if-none-match'] = cached["etag"]
+    if cached and cached["last_modified"]:
+        headers['if-modified-since'] = cached["last_modified"]
+
+    async with session_scope(session) as http:
+        async with http.get(url=NEWS_LIST_URL, params=params, headers=headers, timeout=NEWS_TIMEOUT) as response:
+            if response.status == 304 and cached:
+                FEED_STATS["not_modified"] += 1
+                return {**cached["page"], "changed": False}
+
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+    digest = hashlib.blake2b(body, digest_size=16).digest()
+    if cached and cached["digest"] == digest:
+        FEED_STATS["unchanged"] += 1
+        return {**cached["page"], "changed": False}
+
+    content = orjson.loads(body).get("content") or []
+    page_data = {
+        "content": content,
+        "newest": max((article.get('createdAt', 0) for article in content), default=0),
     }
-    
-    try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url=url, params=params, headers=headers) as response:
-                data = await response.json()
-                lol_new_articles = data.get("content", [])
-        
-        return lol_new_articles
-
-    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-        # 로그 출력하거나 빈 리스트 반환
-        print(f"❌ 롤 뉴스 API 요청 실패: {e}")
-        return []
-    
+    FEED_STATS["fetched"] += 1
+
+    _feed_cache.pop(cache_key, None)
+    _feed_cache[cache_key] = {"etag": etag, "last_modified": last_modified, "digest": digest, "page": page_data}
+    while len(_feed_cache) > MAX_FEED_CACHE:
+        del _feed_cache[next(iter(_feed_cache))]
+
+    return {**page_data, "changed": True}
 
-async def valorant_news_articles(formatted_date: str) -> List[Dict[str, Any]]:
+
+async def fetch_news_day(news_type: str, formatted_date: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
     """
-    주어진 날짜의 네이버 e스포츠(발로란트) 뉴스 목록을 비동기로 가져옵니다.
+    네이버 e스포츠 뉴스 목록 API를 페이지 단위로 호출해 해당 날짜의 기사 전체를 반환합니다.
+    요청이 실패하면 예외를 그대로 올려, 호출하는 쪽이 "기사 없음"과 "실패"를 구분할 수 있게 합니다.
 
     Args:
+        news_type (str): 네이버 API의 newsType 값 (lol / valorant / overwatch)
         formatted_date (str): 'YYYY-MM-DD' 형식의 날짜 문자열
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용
 
     Returns:
-        List[Dict]: 해당 날짜의 신규 뉴스 기사 목록 (lastProcessedAt 이후 기사만 반환)
+        List[Dict]: 해당 날짜의 기사 목록 (최신순)
     """
-    url = f'https://esports-api.game.naver.com/service/v1/news/list?sort=latest&newsType=valorant&day={formatted_date}&page=1&pageSize=20'
+    articles = []
+    for page in range(1, MAX_NEWS_PAGES + 1):
+        content = (await _request_news_page(news_type, formatted_date, page, session))["content"]
+        articles.extend(content)
+        # 페이지가 덜 찼으면 마지막 페이지
+        if len(content) < NEWS_PAGE_SIZE:
+            break
+    return articles
 
-    params = {
-        'access-control-allow-credentials': 'true',
-        'access-control-allow-origin': 'https://game.naver.com'
-    }
 
-    headers = {
-        'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.15 Safari/537.36'
-    }
-    
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url=url, params=params, headers=headers) as response:
-                data = await response.json()
-                valorant_new_articles = data.get("content", [])
+async def _fetch_news_list(news_type: str, game_name: str, formatted_date: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
+    """
+    해당 날짜의 기사 전체를 반환합니다. (fetch_news_day 참고, 실패 시 빈 리스트)
 
-        return valorant_new_articles
+    Args:
+        news_type (str): 네이버 API의 newsType 값 (lol / valorant / overwatch)
+        game_name (str): 로그에 표시할 게임 이름
+        formatted_date (str): 'YYYY-MM-DD' 형식의 날짜 문자열
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용
+
+    Returns:
+        List[Dict]: 해당 날짜의 기사 목록 (최신순, 실패 시 빈 리스트)
+    """
+    try:
+        return await fetch_news_day(news_type, formatted_date, session)
 
-    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
         # 요청 실패 시 로그 출력 및 빈 리스트 반환
-        print(f"❌ 발로란트 뉴스 API 요청 실패: {e}")
+        print(f"❌ {game_name} 뉴스 API 요청 실패: {e}")
         return []
 
 
-async def overwatch_news_articles(formatted_date: str) -> List[Dict[str, Any]]:
+async def fetch_news_since(news_type: str, last_at: int, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
     """
-    주어진 날짜의 네이버 e스포츠(오버워치) 뉴스 목록을 비동기로 가져옵니다.
+    lastProcessedAt(last_at) 이후에 생성된 기사를 빠짐없이 가져옵니다.
+
+    오늘(KST)부터 last_at이 속한 날짜까지 하루씩 거슬러 올라가며 최신순 페이지를 차례로 요청하고,
+    last_at 이하의 기사가 나오는 순간 멈춥니다. 따라서 폴링 사이에 20개가 넘는 기사가 올라왔거나
+    자정을 넘긴 경우에도 누락 없이, 필요한 페이지만 요청합니다.
+    요청 실패 시 예외를 그대로 전달하므로, 호출 측은 이번 사이클의 워터마크를 갱신하지 않아야 합니다.
+
+    Args:
+        news_type (str): 네이버 API의 newsType 값 (lol / valorant / overwatch)
+        last_at (int): 마지막으로 처리한 기사의 createdAt (ms). 0이면 오늘 기사만 가져옴
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션
+
+    Returns:
+        List[Dict]: last_at 이후의 신규 기사 목록 (최신순)
+    """
+    today = today_kst()
+    oldest_day = today
+    if last_at:
+        last_day = datetime.fromtimestamp(last_at / 1000, tz=KST).date()
+        oldest_day = max(last_day, today - timedelta(days=MAX_CATCHUP_DAYS))
+
+    new_articles = []
+    day = today
+    while day >= oldest_day:
+        for page in range(1, MAX_NEWS_PAGES + 1):
+            result = await _request_news_page(news_type, day.strftime('%Y-%m-%d'), page, session)
+
+            # 이전 응답과 같고 이미 워터마크까지 처리한 페이지라면 필터링 없이 바로 종료 (변경 없는 사이클)
+            if not result["changed"] and result["content"] and result["newest"] <= last_at:
+                if not new_articles:
+                    FEED_STATS["noop"] += 1
+                return new_articles
+
+            content = result["content"]
+            fresh = [article for article in content if article.get('createdAt', 0) > last_at]
+            new_articles.extend(fresh)
+
+            # 워터마크에 도달하면 더 오래된 페이지/날짜는 볼 필요가 없음
+            if len(fresh) < len(content):
+                return new_articles
+            if len(content) < NEWS_PAGE_SIZE:
+                break
+        day -= timedelta(days=1)
+
+    return new_articles
+
+
+async def lol_news_articles(formatted_date: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
+    """
+    주어진 날짜의 네이버 e스포츠(롤) 뉴스 목록을 비동기로 가져옵니다.
 
     Args:
         formatted_date (str): 'YYYY-MM-DD' 형식의 날짜 문자열
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션
 
     Returns:
         List[Dict]: 해당 날짜의 뉴스 기사 목록 (API 응답의 "content" 리스트)
     """
-    url = f'https://esports-api.game.naver.com/service/v1/news/list?sort=latest&newsType=overwatch&day={formatted_date}&page=1&pageSize=20'
+    return await _fetch_news_list("lol", "롤", formatted_date, session)
 
-    params = {
-        'access-control-allow-credentials': 'true',
-        'access-control-allow-origin': 'https://game.naver.com'
-    }
 
-    headers = {
-        'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.15 Safari/537.36'
-    }
-    
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url=url, params=params, headers=headers) as response:
-                data = await response.json()
-                overwatch_new_articles = data.get("content", [])
+async def valorant_news_articles(formatted_date: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
+    """
+    주어진 날짜의 네이버 e스포츠(발로란트) 뉴스 목록을 비동기로 가져옵니다.
 
-        return overwatch_new_articles
+    Args:
+        formatted_date (str): 'YYYY-MM-DD' 형식의 날짜 문자열
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션
 
-    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-        # 요청 실패 시 로그 출력 및 빈 리스트 반환
-        print(f"❌ 오버워치 뉴스 API 요청 실패: {e}")
-        return []
+    Returns:
+        List[Dict]: 해당 날짜의 뉴스 기사 목록 (API 응답의 "content" 리스트)
+    """
+    return await _fetch_news_list("valorant", "발로란트", formatted_date, session)
+
+
+async def overwatch_news_articles(formatted_date: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
+    """
+    주어진 날짜의 네이버 e스포츠(오버워치) 뉴스 목록을 비동기로 가져옵니다.
 
+    Args:
+        formatted_date (str): 'YYYY-MM-DD' 형식의 날짜 문자열
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션
 
-async def fetch_news_articles() -> List[Dict[str, Any]]:
+    Returns:
+        List[Dict]: 해당 날짜의 뉴스 기사 목록 (API 응답의 "content" 리스트)
+    """
+    return await _fetch_news_list("overwatch", "오버워치", formatted_date, session)
+
+
+async def fetch_news_articles(session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
     """
     네이버 e스포츠 뉴스 사이트에서 최신 기사를 가져와,
     마지막 처리 시각(lastProcessedAt) 이후에 생성된 기사만 필터링하여 반환합니다.
 
+    Args:
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션
+
     Returns:
         List[Dict]: 해당 날짜의 신규 뉴스 기사 목록 (lastProcessedAt 이후 기사만 반환)
     """
@@ -124,13 +264,13 @@ async def fetch_news_articles() -> List[Dict[str, Any]]:
     formatted_date = date.today().strftime('%Y-%m-%d')
     
     # LOL e-sports 뉴스를 크롤링하는 함수로 분리
-    lol_new_articles = await lol_news_articles(formatted_date)
+    lol_new_articles = await lol_news_articles(formatted_date, session)
 
     # Valorant e-sports 뉴스를 크롤링하는 함수로 분리
-    valorant_new_articles = await valorant_news_articles(formatted_date)
+    valorant_new_articles = await valorant_news_articles(formatted_date, session)
 
     # Overwatch e-sports 뉴스를 크롤링하는 함수로 분리
-    overwatch_new_articles = await overwatch_news_articles(formatted_date)
+    overwatch_new_articles = await overwatch_news_articles(formatted_date, session)
 
     # 세 게임의 신규 기사 리스트를 createdAt 기준으로 정렬하며, 하나로 결합
     all_new_articles = list(heapq.merge(
@@ -1,3 +1,4 @@
+import os
 import aiohttp
 import orjson
 import asyncio
@@ -8,31 +9,113 @@ from typing import List, Dict, Any
 from datetime import date
 
 STATE_FILE = Path("news_state.json")
+JOURNAL_FILE = Path("news_state.journal")
+
+# 저널 항목이 이만큼 쌓이면 스냅샷(STATE_FILE)으로 압축하고 저널을 비운다.
+COMPACT_EVERY = 100
+
+# 스냅샷 + 저널을 재생한 현재 상태 (처음 load_state()/save_state() 때 한 번만 파일에서 읽음)
+_state = None
+_journal_entries = 0
+
+
+def _fsync_dir(path: Path):
+    """rename/생성한 파일의 디렉터리 항목까지 디스크에 반영한다. (지원하지 않는 OS는 무시)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _load_from_disk() -> dict:
+    """
+    스냅샷을 읽고 그 뒤에 쌓인 저널 항목을 순서대로 재생한다.
+    마지막 줄이 쓰다 만 상태(프로세스가 append 도중 종료)라면 그 줄은 무시한다.
+    """
+    global _journal_entries
+    state = orjson.loads(STATE_FILE.read_bytes()) if STATE_FILE.exists() else {}
+
+    _journal_entries = 0
+    if JOURNAL_FILE.exists():
+        data = JOURNAL_FILE.read_bytes()
+        if data and not data.endswith(b"\n"):
+            # 쓰다 만 마지막 줄을 잘라내, 다음 append가 깨진 줄 뒤에 이어 붙지 않게 함
+            data = data[:data.rfind(b"\n") + 1]
+            with open(JOURNAL_FILE, "r+b") as f:
+                f.truncate(len(data))
+        for line in data.splitlines():
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            state[entry["game"]] = {"lastProcessedAt": entry["lastProcessedAt"]}
+            _journal_entries += 1
+    return state
+
+
+def compact_state():
+    """
+    현재 상태를 임시 파일에 쓰고 fsync 후 os.replace로 스냅샷을 원자적으로 교체한 뒤, 저널을 비운다.
+    교체 도중 종료되어도 이전 스냅샷 또는 새 스냅샷 중 하나가 온전히 남고, 남은 저널은 재생해도 결과가 같다.
+    """
+    global _journal_entries
+    state = load_state()
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_file = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(state, option = orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, STATE_FILE)
+    _fsync_dir(STATE_FILE.parent)
+
+    with open(JOURNAL_FILE, "wb") as f:
+        os.fsync(f.fileno())
+    _journal_entries = 0
+
 
 def save_state(game: str, last_at: int):
     """
-    'news_state.json'에 lastProcessedAt을 기록한다.
+    lastProcessedAt 변경을 저널('news_state.journal')에 한 줄 추가한다.
+    전체 파일을 다시 쓰지 않고, COMPACT_EVERY개마다 스냅샷('news_state.json')으로 압축한다.
 
     Args:
         game (str): lastProcessedAt을 기록할 key 값. (롤/발로란트/오버워치)
         last_at (int): 알림으로 남긴 마지막 기사의 createdAt 값.
     """
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    state = load_state()
-    state[game] = {"lastProcessedAt": last_at } # 개임별로 마지막으로 처리한 시각
-    STATE_FILE.write_bytes(orjson.dumps(state, option = orjson.OPT_INDENT_2))
+    global _journal_entries
+    load_state()
+    JOURNAL_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(JOURNAL_FILE, "ab") as f:
+        f.write(orjson.dumps({"game": game, "lastProcessedAt": last_at}) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+    _state[game] = {"lastProcessedAt": last_at } # 개임별로 마지막으로 처리한 시각
+    _journal_entries += 1
+    if _journal_entries >= COMPACT_EVERY:
+        compact_state()
 
 
 def load_state() -> dict:
     """
-    'news_state.json'에서 lastProcessedAt을 가져온다.
+    lastProcessedAt 상태를 가져온다. (처음 한 번만 스냅샷 + 저널을 읽고, 이후에는 메모리에서 반환)
 
     Returns:
         dict: lastProcessedAt이 key 값으로 담긴 dict를 로드한 값.
     """
-    if not STATE_FILE.exists():
-        return {}
-    return orjson.loads(STATE_FILE.read_bytes())
+    global _state
+    if _state is None:
+        _state = _load_from_disk()
+    return dict(_state)
 
 
 def update_state(game: str, articles: List[Dict[str, Any]]):
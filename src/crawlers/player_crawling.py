@@ -5,6 +5,9 @@ import aiohttp
 import requests
 import re
 
+from typing import Optional
+from crawlers.http_client import session_scope
+
 def split_country_field(value: str):
     """
     KRKorea, CNChina, JPJapan 등에서 2글자 코드와 나머지 분리.
@@ -269,7 +272,7 @@ def search_valorant_players(player_name: str) -> list:
         return None
     
 
-async def fetch_valorant_player_info(player_name: str, real_name: str, player_link: str) -> dict:
+async def fetch_valorant_player_info(player_name: str, real_name: str, player_link: str, session: Optional[aiohttp.ClientSession] = None) -> dict:
     """
     VLR 플레이어 프로필 페이지에서 플레이어 정보를 추출한다.
 
@@ -277,6 +280,7 @@ async def fetch_valorant_player_info(player_name: str, real_name: str, player_li
         player_name (str): 플레이어 닉네임
         real_name (str): 플레이어 실명
         player_link (str): 플레이어 프로필 페이지 링크
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용
 
     Returns:
         dict: 플레이어 정보
@@ -294,8 +298,8 @@ async def fetch_valorant_player_info(player_name: str, real_name: str, player_li
         'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.22 Safari/537.36',
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url=player_link, headers=headers) as response:
+    async with session_scope(session) as http:
+        async with http.get(url=player_link, headers=headers) as response:
             if response.status == 200:
                 soup = BeautifulSoup(await response.text(), 'html.parser')
 
@@ -0,0 +1,172 @@
+import time
+import asyncio
+import aiohttp
+
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from crawlers.schedule_crawling import (
+    LOL_LEAGUE_TYPE,
+    VALORANT_LEAGUE_TYPE,
+    fetch_monthly_lol_league_schedule,
+    fetch_valorant_league_schedule,
+    parse_lol_month_days,
+)
+
+
+class PollScheduler:
+    """
+    게임별 뉴스 폴링 간격을 정하는 수요 기반 스케줄러.
+
+    - 최근 rate_window초 동안의 기사 발행 속도로 간격을 정한다. (기사가 뜸하면 길게, 잦으면 짧게)
+    - 경기 시작 전후(match_lead ~ match_tail)에는 최소 간격으로 폴링한다.
+    - 구독 채널이 없는 게임은 폴링하지 않는다.
+    """
+
+    def __init__(
+        self,
+        games: Iterable[str],
+        min_interval: float = 300,
+        max_interval: float = 1800,
+        rate_window: float = 6 * 3600,
+        match_lead: float = 1800,
+        match_tail: float = 3 * 3600,
+    ):
+        self.games = tuple(games)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.rate_window = rate_window
+        self.match_lead = match_lead
+        self.match_tail = match_tail
+
+        self.next_poll_at: Dict[str, float] = {game: 0.0 for game in self.games}
+        self.publish_history: Dict[str, deque] = {game: deque() for game in self.games}
+        self.match_times: Dict[str, List[float]] = {game: [] for game in self.games}
+        self.match_times_updated_at = 0.0
+
+        # 구독자가 없어 쉬는 중인 게임 → 다시 폴링을 시작할 때 이 시각(ms) 이전 기사는 보내지 않음
+        self.idle_games: set = set()
+        self.resume_floor: Dict[str, int] = {}
+
+    def publish_rate(self, game: str, now: float) -> float:
+        """최근 rate_window초 동안의 시간당 기사 발행 수를 반환한다."""
+        history = self.publish_history[game]
+        cutoff_ms = (now - self.rate_window) * 1000
+        while history and history[0] < cutoff_ms:
+            history.popleft()
+        return len(history) * 3600 / self.rate_window
+
+    def near_match(self, game: str, now: float) -> bool:
+        """경기 시작 match_lead초 전부터 시작 후 match_tail초까지인지 확인한다."""
+        return any(start - self.match_lead <= now <= start + self.match_tail for start in self.match_times[game])
+
+    def interval_for(self, game: str, now: float = None) -> float:
+        """
+        게임의 다음 폴링 간격(초)을 계산한다.
+        평균적으로 한 번 폴링할 때 기사 1건 정도가 쌓이도록 (3600 / 시간당 기사 수) 간격을 잡고,
+        min_interval ~ max_interval 범위로 제한한다.
+        """
+        now = now or time.time()
+        if self.near_match(game, now):
+            return self.min_interval
+
+        rate = self.publish_rate(game, now)
+        if rate <= 0:
+            return self.max_interval
+        return min(self.max_interval, max(self.min_interval, 3600 / rate))
+
+    def due_games(self, subscriber_counts: Dict[str, int], now: float = None) -> List[str]:
+        """
+        지금 폴링해야 하는 게임 목록을 반환한다.
+
+        Args:
+            subscriber_counts (Dict[str, int]): 게임별 구독 채널 수
+            now (float): 현재 시각 (epoch 초)
+
+        Returns:
+            List[str]: 폴링 시각이 된, 구독자가 있는 게임 목록
+        """
+        now = now or time.time()
+        due = []
+        for game in self.games:
+            if subscriber_counts.get(game, 0) <= 0:
+                self.idle_games.add(game)
+                continue
+            if game in self.idle_games:
+                # 구독자가 다시 생기면 밀린 기사 대신 지금부터의 기사만 전송
+                self.idle_games.discard(game)
+                self.resume_floor[game] = int(now * 1000)
+                self.next_poll_at[game] = now
+            if now >= self.next_poll_at[game]:
+                due.append(game)
+        return due
+
+    def watermark(self, game: str, last_at: int) -> int:
+        """저장된 lastProcessedAt과 재개 시각 중 더 최근 값을 반환한다."""
+        return max(last_at, self.resume_floor.get(game, 0))
+
+    def record(self, game: str, articles: List[Dict[str, Any]], now: float = None):
+        """
+        폴링 결과를 기록하고 다음 폴링 시각을 정한다.
+
+        Args:
+            game (str): 게임 key
+            articles (List[Dict]): 이번 폴링에서 받은 신규 기사 목록
+            now (float): 현재 시각 (epoch 초)
+        """
+        now = now or time.time()
+        history = self.publish_history[game]
+        for created_at in sorted(article.get('createdAt', 0) for article in articles):
+            history.append(created_at)
+        self.next_poll_at[game] = now + self.interval_for(game, now)
+
+    def set_match_times(self, match_times: Dict[str, List[float]], now: float = None):
+        """게임별 경기 시작 시각(epoch 초) 목록을 갱신한다."""
+        for game in self.games:
+            self.match_times[game] = sorted(match_times.get(game, []))
+        self.match_times_updated_at = now or time.time()
+
+
+def _start_epoch(match: Dict[str, Any]) -> Optional[float]:
+    start_date = match.get("startDate")
+    if not start_date:
+        return None
+    try:
+        return datetime.fromisoformat(start_date).timestamp()
+    except ValueError:
+        return None
+
+
+async def fetch_match_start_times(
+    naver_session: Optional[aiohttp.ClientSession] = None,
+    opgg_session: Optional[aiohttp.ClientSession] = None,
+) -> Dict[str, List[float]]:
+    """
+    일정 크롤러로 지원 리그들의 이번 달 경기 시작 시각을 모은다.
+
+    Returns:
+        Dict[str, List[float]]: 게임 key("lol", "valorant")별 경기 시작 시각(epoch 초) 목록
+    """
+    year_month = datetime.now(timezone.utc).strftime("%Y-%m")
+
+    lol_results, valorant_results = await asyncio.gather(
+        asyncio.gather(*(
+            fetch_monthly_lol_league_schedule(year_month, league_code, session=naver_session)
+            for league_code in LOL_LEAGUE_TYPE.values()
+        ), return_exceptions=True),
+        asyncio.gather(*(
+            fetch_valorant_league_schedule(league_code, session=opgg_session)
+            for league_code in VALORANT_LEAGUE_TYPE.values()
+        ), return_exceptions=True),
+    )
+
+    match_times = {"lol": [], "valorant": []}
+    for month_resp in lol_results:
+        if isinstance(month_resp, dict):
+            match_times["lol"].extend(_start_epoch(match) for match in parse_lol_month_days(month_resp))
+    for matches in valorant_results:
+        if isinstance(matches, list):
+            match_times["valorant"].extend(_start_epoch(match) for match in matches)
+
+    return {game: [t for t in times if t is not None] for game, times in match_times.items()}
@@ -0,0 +1,97 @@
+import time
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class ScheduleCache:
+    """
+    리그 일정 조회 결과 캐시 (single-flight + stale-while-revalidate).
+
+    - ttl초 안의 결과는 그대로 반환한다.
+    - ttl이 지났지만 stale_ttl초 안이면 이전 결과를 바로 반환하고, 백그라운드에서 한 번만 다시 가져온다.
+    - 캐시가 없거나 stale_ttl도 지났으면 가져올 때까지 기다린다.
+    - 같은 key를 동시에 조회하면 업스트림 요청은 하나만 보내고 모두 같은 결과를 받는다.
+    반환값은 여러 요청이 공유하므로 수정하지 말 것.
+    """
+
+    def __init__(self, ttl: float = 60, stale_ttl: float = 15 * 60):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self.inflight: Dict[Hashable, asyncio.Task] = {}
+        self.stats = {"fresh": 0, "stale": 0, "miss": 0, "coalesced": 0}
+
+    def peek(self, key: Hashable, max_age: float = None):
+        """
+        캐시된 결과를 요청 없이 반환한다. (없거나 max_age초보다 오래됐으면 None)
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if max_age is not None and time.monotonic() - entry[0] > max_age:
+            return None
+        return entry[1]
+
+    def age(self, key: Hashable) -> float:
+        """캐시된 결과의 나이(초). 없으면 무한대."""
+        entry = self.entries.get(key)
+        return time.monotonic() - entry[0] if entry else float("inf")
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        """
+        key의 일정을 반환한다.
+
+        Args:
+            key: 캐시 key (예: ("lol", "lck"))
+            loader: 캐시가 없거나 오래됐을 때 업스트림에서 결과를 가져오는 함수
+
+        Returns:
+            loader의 결과 (None이면 캐시하지 않음)
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                self.stats["fresh"] += 1
+                return entry[1]
+            if age < self.stale_ttl:
+                self.stats["stale"] += 1
+                self.refresh(key, loader)
+                return entry[1]
+
+        self.stats["miss"] += 1
+        return await asyncio.shield(self.refresh(key, loader))
+
+    def refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """
+        key를 다시 가져오는 작업을 시작한다. 이미 진행 중이면 그 작업을 반환한다.
+        """
+        task = self.inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            return task
+
+        task = asyncio.create_task(self._load(key, loader))
+        self.inflight[key] = task
+        # 기다리는 쪽이 없어도(백그라운드 갱신) 예외가 로그로 남게 함
+        task.add_done_callback(self._log_failure)
+        return task
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        try:
+            value = await loader()
+            if value is not None:
+                self.entries[key] = (time.monotonic(), value)
+            return value
+        finally:
+            self.inflight.pop(key, None)
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            print(f"⚠️ 일정 캐시 갱신 실패: {task.exception()}")
+
+
+# 리그 일정 명령어가 함께 사용하는 일정 캐시
+schedule_cache = ScheduleCache()
@@ -1,7 +1,13 @@
+import time
+import heapq
+import asyncio
 import aiohttp
+from typing import Optional
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 
+from crawlers.http_client import session_scope
+
 _TEAM_NAME_KEYS = (
     "teamCode",
     "nameAcronym",
@@ -18,6 +24,28 @@ _TEAM_IMG_KEYS = (
     "blackImageUrl",
 )
 
+# 지원 리그 (표시 이름 → 리그 코드)
+LOL_LEAGUE_TYPE = {
+    "LCK": "lck",
+    "LPL": "lpl",
+    "LEC": "lec",
+    "LCS": "lcs",
+    "MSI": "msi",
+    "WORLDS": "wrl",
+    "LJL": "ljl",
+    "EWC": "ewc_lol"
+}
+
+VALORANT_LEAGUE_TYPE = {
+    "VCT BR": "brazil",
+    "VCT JP": "japan",
+    "VCT NA": "na",
+    "VCT Pacific": "pacific",
+    "VCT Americas": "americas",
+    "VCT EMEA": "emea",
+    "Valorant Masters":  "masters",
+}
+
 # 별칭 → 표준 키
 VALORANT_LEAGUE_ALIAS = {
     "masters":  "masters", "MASTER": "masters", "마스터스": "masters",
@@ -40,7 +68,7 @@ VALORANT_LEAGUE_IDS = {
     "brazil":   ["633"],
 }
 
-async def fetch_lol_league_schedule_months(year_str: str, league_str: str):
+async def fetch_lol_league_schedule_months(year_str: str, league_str: str, session: Optional[aiohttp.ClientSession] = None):
     """네이버 e스포츠 API에서 *해당 연도의 월 목록*을 가져옵니다.
 
     `/v1/schedule/year/months` 엔드포인트를 호출해 특정 연도에
@@ -50,6 +78,7 @@ async def fetch_lol_league_schedule_months(year_str: str, league_str: str):
     매개변수
         year_str (str): 4자리 연도 문자열. 예) 2024.
         league_str (str): 리그 식별자(`topLeagueId`). 예) LCK.
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용.
 
     반환값
         dict | None: 응답 코드가 200이면 JSON 딕셔너리, 아니면 `None`.
@@ -68,8 +97,8 @@ async def fetch_lol_league_schedule_months(year_str: str, league_str: str):
     }
 
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, params=params, headers=headers) as response:
+    async with session_scope(session) as http:
+        async with http.get(url, params=params, headers=headers) as response:
             if response.status == 200:
                 data = await response.json()
                 return data
@@ -79,7 +108,7 @@ async def fetch_lol_league_schedule_months(year_str: str, league_str: str):
                 print(f"응답 내용: {response_text}")
                 return None
             
-async def fetch_monthly_lol_league_schedule(year_month_str: str, league_str: str):
+async def fetch_monthly_lol_league_schedule(year_month_str: str, league_str: str, session: Optional[aiohttp.ClientSession] = None):
     """네이버 e스포츠 API에서 *특정 월*의 경기 일정을 가져옵니다.
 
     `/v2/schedule/month` 엔드포인트를 호출해 주어진 월(YYYYMM)과
@@ -89,6 +118,7 @@ async def fetch_monthly_lol_league_schedule(year_month_str: str, league_str: str
     매개변수
         year_month_str (str): 연월 문자열 `YYYYMM`. 예) 202404.
         league_str (str): 리그 식별자(`topLeagueId`).
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용.
 
     반환값
         dict | None: 성공 시 JSON 딕셔너리, 실패 시 `None`.
@@ -106,8 +136,8 @@ async def fetch_monthly_lol_league_schedule(year_month_str: str, league_str: str
         'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.22 Safari/537.36'
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, params=params, headers=headers) as response:
+    async with session_scope(session) as http:
+        async with http.get(url, params=params, headers=headers) as response:
             if response.status == 200:
                 data = await response.json()
                 return data
@@ -228,6 +258,95 @@ def parse_lol_month_days(days_resp: dict) -> list[dict]:
 
     return matches
 
+# (연도, 리그)별 월 목록 캐시 유지 시간 (초). 월 목록은 시즌 중에 거의 바뀌지 않음
+MONTHS_CACHE_TTL = 6 * 3600
+
+# (연도, 리그) → (만료 시각(monotonic), 월 목록)
+_months_cache: dict[tuple[str, str], tuple[float, list[str]]] = {}
+
+
+async def fetch_lol_league_months_cached(year_str: str, league_str: str, session: Optional[aiohttp.ClientSession] = None) -> Optional[list[str]]:
+    """
+    해당 연도에 일정이 있는 월 목록('YYYY-MM')을 반환합니다. MONTHS_CACHE_TTL 동안은 캐시에서 반환합니다.
+    요청에 실패하면 캐시하지 않고 None을 반환합니다. (일정이 없는 해와 구분)
+    """
+    key = (year_str, league_str)
+    cached = _months_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    months_resp = await fetch_lol_league_schedule_months(year_str, league_str, session=session)
+    if not months_resp:
+        return None
+    months = months_resp.get("content") or []
+    _months_cache[key] = (time.monotonic() + MONTHS_CACHE_TTL, months)
+    return months
+
+
+async def fetch_upcoming_lol_matches(league_str: str, limit: int = 4, session: Optional[aiohttp.ClientSession] = None) -> Optional[list[dict]]:
+    """
+    오늘(UTC) 이후 가장 빠른 limit개 경기를 시작 시각 순으로 반환합니다.
+
+    이번 달 이후의 월 일정을 모두 동시에 요청하고, 월 순서대로 결과를 확인하다가
+    limit개가 모이면 (이후 달의 경기는 더 늦으므로) 나머지 요청은 취소합니다.
+
+    Args:
+        league_str (str): 리그 식별자 (예: lck)
+        limit (int): 반환할 경기 수
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용.
+
+    Returns:
+        list[dict] | None: 경기 목록 (parse_lol_month_days 형식).
+            월 목록 조회에 실패했거나, 확인해야 할 달의 요청이 재시도 후에도 실패하면 None (빈 리스트는 실제로 예정된 경기가 없을 때만)
+    """
+    now_dt = datetime.now(timezone.utc)
+    today_iso = now_dt.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+    now_ym = now_dt.strftime("%Y-%m")
+
+    months = await fetch_lol_league_months_cached(now_dt.strftime("%Y"), league_str, session=session)
+    if months is None:
+        return None
+    months = sorted(m for m in months if m >= now_ym)
+
+    tasks = [
+        asyncio.create_task(fetch_monthly_lol_league_schedule(ym, league_str, session=session))
+        for ym in months
+    ]
+    candidates: list[dict] = []
+    try:
+        for ym, task in zip(months, tasks):
+            month_resp = await _await_month(task, ym)
+            if month_resp is None:
+                # 실패한 달을 건너뛰면 그 달의 (더 이른) 경기가 빠진 목록이 "다가오는 경기"로 반환되므로 한 번 다시 요청
+                month_resp = await _await_month(fetch_monthly_lol_league_schedule(ym, league_str, session=session), ym)
+            if month_resp is None:
+                # 다시 실패하면 조회 실패로 처리 (None은 일정 캐시에 남지 않음)
+                return None
+            for match in parse_lol_month_days(month_resp):
+                if match["startDate"] and match["startDate"] >= today_iso:
+                    candidates.append(match)
+            if len(candidates) >= limit:
+                break
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # 중단 전에 이미 실패한 요청의 예외를 회수 (Task exception was never retrieved 방지)
+                task.exception()
+
+    return heapq.nsmallest(limit, candidates, key=lambda m: m["startDate"])
+
+
+async def _await_month(request, ym: str) -> Optional[dict]:
+    """월 일정 요청을 기다려 응답을 반환합니다. 실패하면 로그를 남기고 None을 반환합니다."""
+    try:
+        return await request
+    except Exception as e:
+        print(f"❌ 롤 {ym} 일정 조회 실패: {e!r}")
+        return None
+
+
 def _find_team_img(team: dict | None) -> str | None:
     """팀 객체 딕셔너리에서 사용하기 좋은 로고 URL을 찾아 반환합니다."""
     if not isinstance(team, dict):
@@ -239,9 +358,16 @@ def _find_team_img(team: dict | None) -> str | None:
     return None
 
 
-async def fetch_valorant_league_schedule(league_input: str):
+async def fetch_valorant_league_schedule(league_input: str, session: Optional[aiohttp.ClientSession] = None):
     """
     발로란트 리그 일정을 크롤링합니다.
+
+    Args:
+        league_input (str): 리그 별칭 (예: "pacific", "퍼시픽")
+        session (aiohttp.ClientSession | None): 공용 HttpClient의 세션. 없으면 임시 세션을 사용.
+
+    Returns:
+        list[dict] | None: 경기 목록 (예정된 경기가 없으면 빈 리스트). HTTP 오류/응답 파싱 실패 시 None
     """
     # 1. 입력받은 별칭(league_input)으로 표준 키 찾기
     standard_key = VALORANT_LEAGUE_ALIAS.get(league_input.lower())
@@ -291,14 +417,19 @@ async def fetch_valorant_league_schedule(league_input: str):
     }
 
     # 4. 요청 보내기
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=payload) as response:
+    async with session_scope(session) as http:
+        async with http.post(url, headers=headers, json=payload) as response:
             if response.status == 200:
                 data = await response.json()
 
-                matches = data.get('data', {}).get('matchesBySeries')
-                if not matches:
+                matches = (data.get('data') or {}).get('matchesBySeries')
+                if matches is None:
+                    # 응답 형식이 다르거나 GraphQL 오류 → 조회 실패
+                    print(f"❌ 발로란트 일정 응답 파싱 실패: {data.get('errors')}")
                     return None
+                if not matches:
+                    # 예정된 경기가 없는 리그 (비시즌) → 실패가 아니므로 빈 리스트
+                    return []
                 
                 sorted_matches = sorted(matches, key=lambda x: x.get('scheduledAt'))
 
@@ -338,5 +469,4 @@ async def fetch_valorant_league_schedule(league_input: str):
             
 
 if __name__ == "__main__":
-    import asyncio
     print(asyncio.run(fetch_valorant_league_schedule("퍼시픽")))
\ No newline at end of file
@@ -1,31 +1,96 @@
-# DB 연결 관리
-from .connection import connect_db, ensure_pool, get_pool
+import os
 
-# 뉴스 상태 관리
-from .news_db import save_state, load_state, update_state
+# 저장소 백엔드 선택: DB_BACKEND=postgres(기본, asyncpg 풀) 또는 sqlite(내장 SQLite, WAL 모드)
+DB_BACKEND = os.getenv("DB_BACKEND", "postgres").lower()
 
-# 채널 설정 관리
-from .channel_db import (
-    save_channel_state,
-    load_channel_state,
-    load_all_channel_state,
-    delete_channel_state
-)
+# 뉴스 상태 / 전송 기록 컴포넌트 (백엔드와 무관)
+from .news_db import NewsStateStore
+from .delivery_db import DeliveryLedger
+
+if DB_BACKEND == "sqlite":
+    from .sqlite_db import (
+        # DB 연결 관리
+        connect_db, ensure_pool, get_pool, get_pool_metrics, check_pool_health,
+        # 뉴스 상태 관리
+        save_state, save_states, load_state, update_state, news_state,
+        # 기사 전송 기록
+        save_deliveries, load_deliveries, prune_deliveries, delivery_ledger,
+        # 기사 아카이브
+        save_articles, load_articles, mark_archive_days, load_archive_days,
+        # 채널 설정 관리
+        save_channel_state, save_channel_states, load_channel_state, load_channel_states, load_all_channel_state,
+        save_channel_batch_mode, delete_channel_state, delete_channel_states,
+        export_guild_channel_states, import_guild_channel_states, warm_channel_cache,
+    )
+else:
+    # DB 연결 관리
+    from .connection import connect_db, ensure_pool, get_pool, get_pool_metrics, check_pool_health
+
+    # 뉴스 상태 관리
+    from .news_db import save_state, save_states, load_state, update_state, news_state
+
+    # 기사 전송 기록
+    from .delivery_db import save_deliveries, load_deliveries, prune_deliveries, delivery_ledger
+
+    # 기사 아카이브
+    from .archive_db import save_articles, load_articles, mark_archive_days, load_archive_days
+
+    # 채널 설정 관리
+    from .channel_db import (
+        save_channel_state,
+        save_channel_states,
+        load_channel_state,
+        load_channel_states,
+        load_all_channel_state,
+        save_channel_batch_mode,
+        delete_channel_state,
+        delete_channel_states,
+        export_guild_channel_states,
+        import_guild_channel_states,
+        warm_channel_cache
+    )
 
 __all__ = [
+    "DB_BACKEND",
+
     # DB 연결 관리
     "connect_db",
     "ensure_pool",
     "get_pool",
+    "get_pool_metrics",
+    "check_pool_health",
 
     # 뉴스 관리
     "save_state",
+    "save_states",
     "load_state",
     "update_state",
+    "NewsStateStore",
+    "news_state",
+
+    # 기사 전송 기록
+    "save_deliveries",
+    "load_deliveries",
+    "prune_deliveries",
+    "DeliveryLedger",
+    "delivery_ledger",
+
+    # 기사 아카이브
+    "save_articles",
+    "load_articles",
+    "mark_archive_days",
+    "load_archive_days",
 
     # 채널 설정 관리
     "save_channel_state",
+    "save_channel_states",
     "load_channel_state",
+    "load_channel_states",
     "load_all_channel_state",
-    "delete_channel_state"
+    "save_channel_batch_mode",
+    "delete_channel_state",
+    "delete_channel_states",
+    "export_guild_channel_states",
+    "import_guild_channel_states",
+    "warm_channel_cache"
 ]
\ No newline at end of file
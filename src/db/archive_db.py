@@ -0,0 +1,125 @@
+import asyncpg
+from datetime import date
+from .connection import ensure_pool, get_pool
+
+# 기사 식별자: linkUrl, 없으면 제목과 작성 시각
+SQL_UPSERT_ARTICLES = """
+    INSERT INTO news_article (game, article_key, created_at, title, sub_content, link_url, thumbnail)
+    SELECT a.game, COALESCE(NULLIF(a.link_url, ''), COALESCE(a.title, '') || '@' || a.created_at), a.created_at,
+           a.title, a.sub_content, a.link_url, a.thumbnail
+    FROM unnest($1::text[], $2::bigint[], $3::text[], $4::text[], $5::text[], $6::text[])
+        AS a(game, created_at, title, sub_content, link_url, thumbnail)
+    ON CONFLICT (game, article_key) DO UPDATE SET
+        title = EXCLUDED.title, sub_content = EXCLUDED.sub_content, thumbnail = EXCLUDED.thumbnail
+"""
+SQL_SELECT_ARTICLES = """
+    SELECT game, created_at, title, sub_content, link_url, thumbnail FROM news_article
+    WHERE game = ANY($1::text[]) AND created_at >= $2 AND created_at < $3
+    ORDER BY created_at DESC
+"""
+SQL_INSERT_ARCHIVE_DAYS = """
+    INSERT INTO news_archive_day (game, day)
+    SELECT * FROM unnest($1::text[], $2::date[])
+    ON CONFLICT (game, day) DO NOTHING
+"""
+SQL_SELECT_ARCHIVE_DAYS = "SELECT game, day FROM news_archive_day WHERE game = ANY($1::text[]) AND day BETWEEN $2 AND $3"
+
+async def save_articles(articles_by_game: dict[str, list[dict]]) -> bool:
+    """
+    크롤링한 기사를 아카이브(news_article)에 한 문장으로 저장한다. 이미 있는 기사는 내용만 갱신한다.
+
+    Args:
+        articles_by_game (dict[str, list[dict]]): game → 네이버 뉴스 API 기사 목록
+
+    Returns:
+        bool: 성공 여부
+    """
+    rows = [
+        (game, article["createdAt"], article.get("title"), article.get("subContent"), article.get("linkUrl"), article.get("thumbnail"))
+        for game, articles in articles_by_game.items()
+        for article in articles
+    ]
+    if not rows:
+        return True
+
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(SQL_UPSERT_ARTICLES, *(list(column) for column in zip(*rows)))
+        return True
+    except asyncpg.PostgresError as e:
+        print(f"❌ save_articles 오류: {e}")
+        return False
+
+async def load_articles(games: list[str], start_ms: int, end_ms: int) -> dict[str, list[dict]]:
+    """
+    아카이브에서 createdAt이 [start_ms, end_ms) 범위인 기사를 가져온다.
+
+    Args:
+        games (list[str]): 게임 key 목록
+        start_ms (int): 시작 시각 (epoch ms, 포함)
+        end_ms (int): 끝 시각 (epoch ms, 미포함)
+
+    Returns:
+        dict: game → 기사 목록 (최신순, 네이버 뉴스 API와 같은 key 사용)
+    """
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(SQL_SELECT_ARTICLES, list(games), start_ms, end_ms)
+    except asyncpg.PostgresError as e:
+        print(f"❌ load_articles 오류: {e}")
+        return {}
+
+    articles = {game: [] for game in games}
+    for row in rows:
+        articles[row["game"]].append({
+            "title": row["title"],
+            "subContent": row["sub_content"],
+            "linkUrl": row["link_url"],
+            "thumbnail": row["thumbnail"],
+            "createdAt": row["created_at"],
+        })
+    return articles
+
+async def mark_archive_days(days: list[tuple[str, date]]) -> bool:
+    """
+    (game, 날짜)의 기사를 모두 아카이브에 저장했다고 기록한다. 지난 날짜만 기록해야 한다.
+
+    Args:
+        days (list[tuple[str, date]]): (game, KST 날짜) 목록
+
+    Returns:
+        bool: 성공 여부
+    """
+    if not days:
+        return True
+
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(SQL_INSERT_ARCHIVE_DAYS, [game for game, _ in days], [day for _, day in days])
+        return True
+    except asyncpg.PostgresError as e:
+        print(f"❌ mark_archive_days 오류: {e}")
+        return False
+
+async def load_archive_days(games: list[str], start: date, end: date) -> set[tuple[str, date]]:
+    """
+    [start, end] 범위에서 아카이브가 완료된 (game, 날짜) 목록을 가져온다.
+
+    Returns:
+        set: (game, KST 날짜) 집합 (오류 시 빈 집합)
+    """
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(SQL_SELECT_ARCHIVE_DAYS, list(games), start, end)
+            return {(row["game"], row["day"]) for row in rows}
+    except asyncpg.PostgresError as e:
+        print(f"❌ load_archive_days 오류: {e}")
+        return set()
@@ -1,15 +1,181 @@
+import json
+import uuid
+import asyncio
 import asyncpg
-from .connection import ensure_pool, get_pool
+from .connection import ensure_pool, get_pool, get_connect_options
 
-SQL_UPDATE_CHANNEL_STATE = "UPDATE news_channel SET lol = $1, valorant = $2, overwatch = $3 WHERE channel_id = $4"
-SQL_INSERT_CHANNEL_STATE = "INSERT INTO news_channel (channel_id, lol, valorant, overwatch) VALUES ($1, $2, $3, $4)"
-SQL_SELECT_CHANNEL_STATE = "SELECT lol, valorant, overwatch FROM news_channel WHERE channel_id = $1"
-SQL_SELECT_ALL_CHANNEL_STATE = "SELECT channel_id, lol, valorant, overwatch FROM news_channel"
-SQL_DELETE_CHANNEL_STATE = "DELETE FROM news_channel WHERE channel_id = $1"
+# 채널 설정 변경을 다른 레플리카에 알리는 NOTIFY 채널 이름
+NOTIFY_CHANNEL = "news_channel_changed"
+
+# 이 프로세스(레플리카)를 구분하는 ID. 자기 자신이 보낸 NOTIFY는 무시한다.
+REPLICA_ID = uuid.uuid4().hex
+
+# 쓰기 쿼리에서 변경된 행(u)마다 보내는 NOTIFY (쓰기와 같은 문장에서 실행되어 왕복이 추가되지 않음)
+_SQL_NOTIFY_STATE = (
+    f"pg_notify('{NOTIFY_CHANNEL}', json_build_object('origin', '{REPLICA_ID}', 'channel_id', u.channel_id, "
+    "'state', json_build_object('lol', u.lol, 'valorant', u.valorant, 'overwatch', u.overwatch, 'batch_mode', u.batch_mode))::text)"
+)
+_SQL_NOTIFY_DELETE = (
+    f"pg_notify('{NOTIFY_CHANNEL}', json_build_object('origin', '{REPLICA_ID}', 'channel_id', u.channel_id, 'state', NULL)::text)"
+)
+
+SQL_UPSERT_CHANNEL_STATE = f"""
+    WITH u AS (
+        INSERT INTO news_channel (channel_id, lol, valorant, overwatch) VALUES ($1, $2, $3, $4)
+        ON CONFLICT (channel_id) DO UPDATE SET lol = EXCLUDED.lol, valorant = EXCLUDED.valorant, overwatch = EXCLUDED.overwatch
+        RETURNING channel_id, lol, valorant, overwatch, batch_mode
+    )
+    SELECT u.channel_id, u.lol, u.valorant, u.overwatch, u.batch_mode, {_SQL_NOTIFY_STATE} AS notified FROM u
+"""
+SQL_UPSERT_CHANNEL_STATES = f"""
+    WITH u AS (
+        INSERT INTO news_channel (channel_id, lol, valorant, overwatch, batch_mode)
+        SELECT * FROM unnest($1::bigint[], $2::boolean[], $3::boolean[], $4::boolean[], $5::boolean[])
+        ON CONFLICT (channel_id) DO UPDATE SET
+            lol = EXCLUDED.lol, valorant = EXCLUDED.valorant, overwatch = EXCLUDED.overwatch, batch_mode = EXCLUDED.batch_mode
+        RETURNING channel_id, lol, valorant, overwatch, batch_mode
+    )
+    SELECT u.channel_id, u.lol, u.valorant, u.overwatch, u.batch_mode, {_SQL_NOTIFY_STATE} AS notified FROM u
+"""
+SQL_UPDATE_CHANNEL_BATCH_MODE = f"""
+    WITH u AS (
+        UPDATE news_channel SET batch_mode = $1 WHERE channel_id = $2
+        RETURNING channel_id, lol, valorant, overwatch, batch_mode
+    )
+    SELECT u.channel_id, u.lol, u.valorant, u.overwatch, u.batch_mode, {_SQL_NOTIFY_STATE} AS notified FROM u
+"""
+SQL_DELETE_CHANNEL_STATES = f"""
+    WITH u AS (
+        DELETE FROM news_channel WHERE channel_id = ANY($1::bigint[]) RETURNING channel_id
+    )
+    SELECT u.channel_id, {_SQL_NOTIFY_DELETE} AS notified FROM u
+"""
+SQL_SELECT_CHANNEL_STATE = "SELECT lol, valorant, overwatch, batch_mode FROM news_channel WHERE channel_id = $1"
+SQL_SELECT_CHANNEL_STATES = "SELECT channel_id, lol, valorant, overwatch, batch_mode FROM news_channel WHERE channel_id = ANY($1::bigint[])"
+SQL_SELECT_ALL_CHANNEL_STATE = "SELECT channel_id, lol, valorant, overwatch, batch_mode FROM news_channel"
+
+# 채널 ID → 채널 설정값 캐시 (None이면 아직 로드되지 않음)
+_channel_cache: dict[int, dict] | None = None
+
+# LISTEN 전용 연결
+_listener_conn = None
+
+# warm_channel_cache()가 전체 SELECT를 실행하는 동안 도착한 알림 (None이면 모으지 않음)
+_pending_notifies: list[dict] | None = None
+_warm_lock = asyncio.Lock()
+
+
+def _apply_notify(message: dict) -> None:
+    channel_id = int(message["channel_id"])
+    state = message.get("state")
+    if state is None:
+        _channel_cache.pop(channel_id, None)
+    else:
+        _channel_cache[channel_id] = {"channel_id": channel_id, **state}
+
+
+def _on_channel_notify(conn, pid, channel, payload: str) -> None:
+    """다른 레플리카가 보낸 채널 설정 변경 알림을 캐시에 반영한다. (캐시를 채우는 중이면 모아 두었다가 반영)"""
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        return
+    if _pending_notifies is not None:
+        # 전체 SELECT 중에 도착한 알림은 자기 자신이 보낸 것도 포함해 모아 둠 (SELECT 이후의 변경을 놓치지 않기 위함)
+        _pending_notifies.append(message)
+        return
+    if _channel_cache is None or message.get("origin") == REPLICA_ID:
+        return
+    _apply_notify(message)
+
+
+def _on_listener_terminated(conn) -> None:
+    """LISTEN 연결이 끊기면 캐시를 비워, 다음 조회 때 DB에서 다시 로드하고 LISTEN을 재등록하게 한다."""
+    global _channel_cache, _listener_conn
+    print("⚠️ 채널 설정 LISTEN 연결 끊김 → 캐시 초기화")
+    _channel_cache = None
+    _listener_conn = None
+
+
+async def _start_listener() -> None:
+    global _listener_conn
+    if _listener_conn is not None and not _listener_conn.is_closed():
+        return
+    conn = await asyncpg.connect(**get_connect_options())
+    try:
+        conn.add_termination_listener(_on_listener_terminated)
+        await conn.add_listener(NOTIFY_CHANNEL, _on_channel_notify)
+    except BaseException:
+        await conn.close()
+        raise
+    _listener_conn = conn
+
+
+def _row_state(row) -> dict:
+    """쿼리 결과 행에서 채널 설정값 dict를 만든다."""
+    return {
+        "channel_id": row["channel_id"],
+        "lol": row["lol"],
+        "valorant": row["valorant"],
+        "overwatch": row["overwatch"],
+        "batch_mode": row["batch_mode"],
+    }
+
+
+async def _load_channel_rows() -> dict[int, dict] | None:
+    """
+    모든 채널 설정값을 풀에서 읽는다. LISTEN을 시작할 수 있으면 결과를 캐시에 올리고,
+    LISTEN 연결을 열 수 없으면(연결 수 제한, PgBouncer 등) 캐시 없이 결과만 반환한다.
+
+    Returns:
+        dict | None: 채널 ID → 채널 설정값 (조회 실패 시 None)
+    """
+    global _channel_cache, _pending_notifies
+    await ensure_pool()
+    # 동시에 호출돼도 전체 SELECT와 알림 버퍼는 하나만 사용
+    async with _warm_lock:
+        if _channel_cache is not None:
+            return dict(_channel_cache)
+        try:
+            await _start_listener()
+            listening = True
+        except (asyncpg.PostgresError, asyncpg.InterfaceError, OSError, asyncio.TimeoutError) as e:
+            print(f"⚠️ 채널 설정 LISTEN 시작 실패 (캐시 없이 DB에서 조회): {e}")
+            listening = False
+
+        if listening:
+            _pending_notifies = []
+        try:
+            pool = get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(SQL_SELECT_ALL_CHANNEL_STATE)
+            states = {row["channel_id"]: _row_state(row) for row in rows}
+            if listening:
+                _channel_cache = dict(states)
+                for message in _pending_notifies:
+                    _apply_notify(message)
+                return dict(_channel_cache)
+            return states
+        except (asyncpg.PostgresError, OSError) as e:
+            print(f"❌ warm_channel_cache 오류: {e}")
+            return None
+        finally:
+            _pending_notifies = None
+
+async def warm_channel_cache() -> int:
+    """
+    모든 채널 설정값을 DB에서 한 번 읽어 캐시에 올리고, 다른 레플리카의 변경 알림을 LISTEN한다.
+    이후 채널 설정 조회는 DB 왕복 없이 캐시에서 처리된다.
+
+    Returns:
+        int: 읽어 온 채널 수
+    """
+    states = await _load_channel_rows()
+    return len(states) if states else 0
 
 async def save_channel_state(channel_id: int, games: dict[str, bool]) -> bool:
     """
-    데이터베이스 테이블에 해당 채널의 게임 뉴스 설정값을 저장한다.
+    데이터베이스 테이블에 해당 채널의 게임 뉴스 설정값을 저장한다. (upsert 한 번으로 처리)
 
     Args:
         channel_id (int): 채널 ID
@@ -22,27 +188,67 @@ async def save_channel_state(channel_id: int, games: dict[str, bool]) -> bool:
     try:
         pool = get_pool()
         async with pool.acquire() as conn:
-            if await conn.fetch(SQL_SELECT_CHANNEL_STATE, channel_id):
-                await conn.execute(SQL_UPDATE_CHANNEL_STATE, games["lol"], games["valorant"], games["overwatch"], channel_id)
-            else:
-                await conn.execute(SQL_INSERT_CHANNEL_STATE, channel_id, games["lol"], games["valorant"], games["overwatch"])
+            row = await conn.fetchrow(SQL_UPSERT_CHANNEL_STATE, channel_id, games["lol"], games["valorant"], games["overwatch"])
 
     except asyncpg.PostgresError as e:
         print(f"❌ save_channel_state 오류: {e}")
         return False
 
+    if _channel_cache is not None:
+        _channel_cache[channel_id] = _row_state(row)
+    return True
+
+async def save_channel_states(states: dict[int, dict[str, bool]]) -> bool:
+    """
+    여러 채널의 게임 뉴스 설정값을 한 문장(unnest + upsert)으로 저장한다.
+
+    Args:
+        states (dict[int, dict[str, bool]]): 채널 ID → 설정값 (롤, 발로란트, 오버워치, 묶음 전송 여부)
+            batch_mode가 없으면 False로 저장한다.
+
+    Returns:
+        bool: 성공 여부
+    """
+    if not states:
+        return True
+
+    channel_ids = list(states)
+    columns = [
+        [bool(states[channel_id].get(key, False)) for channel_id in channel_ids]
+        for key in ("lol", "valorant", "overwatch", "batch_mode")
+    ]
+
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(SQL_UPSERT_CHANNEL_STATES, channel_ids, *columns)
+
+    except asyncpg.PostgresError as e:
+        print(f"❌ save_channel_states 오류: {e}")
+        return False
+
+    if _channel_cache is not None:
+        for row in rows:
+            _channel_cache[row["channel_id"]] = _row_state(row)
     return True
 
 async def load_channel_state(channel_id: int) -> dict[str, bool]:
     """
-    데이터베이스 테이블로부터 해당 채널의 게임 뉴스 설정값을 로드한다.
+    해당 채널의 게임 뉴스 설정값을 로드한다. (캐시가 있으면 캐시에서 반환)
 
     Args:
         channel_id (int): 채널 ID
 
     Returns:
-        dict: 해당 채널의 게임 뉴스 설정값 (롤, 발로란트, 오버워치)
+        dict: 해당 채널의 게임 뉴스 설정값 (롤, 발로란트, 오버워치, 묶음 전송 여부)
     """
+    if _channel_cache is not None:
+        state = _channel_cache.get(channel_id)
+        if not state:
+            return {}
+        return {key: value for key, value in state.items() if key != "channel_id"}
+
     await ensure_pool()
     try:
         pool = get_pool()
@@ -55,20 +261,66 @@ async def load_channel_state(channel_id: int) -> dict[str, bool]:
     except asyncpg.PostgresError as e:
         print(f"❌ load_channel_state 오류: {e}")
         return {}
+
+async def load_channel_states(channel_ids: list[int]) -> dict[int, dict[str, bool]]:
+    """
+    여러 채널의 게임 뉴스 설정값을 한 번에 로드한다. (캐시가 있으면 캐시에서 반환)
+
+    Args:
+        channel_ids (list[int]): 채널 ID 목록
+
+    Returns:
+        dict: 채널 ID → 설정값 (설정이 없는 채널은 제외)
+    """
+    if _channel_cache is not None:
+        return {channel_id: _channel_cache[channel_id] for channel_id in channel_ids if channel_id in _channel_cache}
+
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(SQL_SELECT_CHANNEL_STATES, list(channel_ids))
+            return {row["channel_id"]: _row_state(row) for row in rows}
+    except asyncpg.PostgresError as e:
+        print(f"❌ load_channel_states 오류: {e}")
+        return {}
     
 async def load_all_channel_state() -> dict[int, dict[str, bool]]:
     """
-    데이터베이스 테이블로부터 모든 채널의 게임 뉴스 설정값을 로드한다.
+    모든 채널의 게임 뉴스 설정값을 로드한다.
+    캐시가 로드되어 있으면 DB 왕복 없이 캐시에서 반환하고, 아니면 DB에서 읽어 캐시를 채운다.
+    """
+    if _channel_cache is not None:
+        return dict(_channel_cache)
+    # LISTEN을 시작하지 못했으면 매번 풀에서 직접 조회 (다음 호출에서 LISTEN을 다시 시도)
+    return await _load_channel_rows() or {}
+
+async def save_channel_batch_mode(channel_id: int, enabled: bool) -> bool:
+    """
+    데이터베이스 테이블에 해당 채널의 뉴스 묶음 전송 여부를 저장한다.
+
+    Args:
+        channel_id (int): 채널 ID
+        enabled (bool): True면 여러 뉴스를 한 메시지로 묶어서 전송
+
+    Returns:
+        bool: 저장 성공 여부 (False: 뉴스 설정이 없는 채널 또는 오류)
     """
     await ensure_pool()
     try:
         pool = get_pool()
         async with pool.acquire() as conn:
-            rows = await conn.fetch(SQL_SELECT_ALL_CHANNEL_STATE)
-            return {row["channel_id"]: dict(row) for row in rows}
+            row = await conn.fetchrow(SQL_UPDATE_CHANNEL_BATCH_MODE, enabled, channel_id)
+            if not row:
+                return False
+
     except asyncpg.PostgresError as e:
-        print(f"❌ load_all_channel_state 오류: {e}")
-        return {}
+        print(f"❌ save_channel_batch_mode 오류: {e}")
+        return False
+
+    if _channel_cache is not None:
+        _channel_cache[channel_id] = _row_state(row)
+    return True
 
 async def delete_channel_state(channel_id: int) -> bool:
     """
@@ -80,15 +332,82 @@ async def delete_channel_state(channel_id: int) -> bool:
     Returns:
         bool: 삭제 성공 여부 (True: 삭제됨, False: 삭제할 데이터 없음 또는 오류)
     """
+    return await delete_channel_states([channel_id]) > 0
+
+async def delete_channel_states(channel_ids: list[int]) -> int:
+    """
+    여러 채널의 게임 뉴스 설정값을 한 문장으로 삭제한다.
+
+    Args:
+        channel_ids (list[int]): 채널 ID 목록
+
+    Returns:
+        int: 삭제된 채널 수 (오류 시 0)
+    """
+    if not channel_ids:
+        return 0
+
     await ensure_pool()
     try:
         pool = get_pool()
         async with pool.acquire() as conn:
-            result = await conn.execute(SQL_DELETE_CHANNEL_STATE, channel_id)
-            deleted_count = int(result.split()[1])
+            rows = await conn.fetch(SQL_DELETE_CHANNEL_STATES, list(channel_ids))
+
+    except asyncpg.PostgresError as e:
+        print(f"❌ delete_channel_states 오류: {e}")
+        return 0
+
+    if _channel_cache is not None:
+        for row in rows:
+            _channel_cache.pop(row["channel_id"], None)
+    return len(rows)
+
+async def export_guild_channel_states(channel_ids: list[int]) -> dict[int, dict[str, bool]]:
+    """
+    서버(길드) 하나의 채널 설정값을 한 번에 내보낸다.
+
+    Args:
+        channel_ids (list[int]): 해당 서버의 채널 ID 목록
+
+    Returns:
+        dict: 채널 ID → 설정값 (설정이 있는 채널만)
+    """
+    return await load_channel_states(channel_ids)
+
+async def import_guild_channel_states(channel_ids: list[int], states: dict[int, dict[str, bool]]) -> bool:
+    """
+    서버(길드) 하나의 채널 설정값을 한 트랜잭션으로 통째로 교체한다.
+    states에 없는 해당 서버의 채널은 설정이 삭제되고, states의 채널은 upsert된다.
+
+    Args:
+        channel_ids (list[int]): 해당 서버의 채널 ID 목록
+        states (dict[int, dict[str, bool]]): 가져올 채널 ID → 설정값
+
+    Returns:
+        bool: 성공 여부
+    """
+    removed_ids = [channel_id for channel_id in channel_ids if channel_id not in states]
+    upsert_ids = list(states)
+    columns = [
+        [bool(states[channel_id].get(key, False)) for channel_id in upsert_ids]
+        for key in ("lol", "valorant", "overwatch", "batch_mode")
+    ]
 
-            return deleted_count > 0
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                deleted_rows = await conn.fetch(SQL_DELETE_CHANNEL_STATES, removed_ids)
+                upserted_rows = await conn.fetch(SQL_UPSERT_CHANNEL_STATES, upsert_ids, *columns)
 
     except asyncpg.PostgresError as e:
-        print(f"❌ delete_channel_state 오류: {e}")
-        return False 
\ No newline at end of file
+        print(f"❌ import_guild_channel_states 오류: {e}")
+        return False
+
+    if _channel_cache is not None:
+        for row in deleted_rows:
+            _channel_cache.pop(row["channel_id"], None)
+        for row in upserted_rows:
+            _channel_cache[row["channel_id"]] = _row_state(row)
+    return True
@@ -1,32 +1,193 @@
 import os
+import time
+import asyncio
 import asyncpg
+from contextlib import asynccontextmanager
+from .schema import apply_schema
 
 pool = None
+_pool_lock = asyncio.Lock()
+
+def get_connect_options() -> dict:
+    """환경 변수로부터 DB 접속 옵션을 만든다. (풀과 LISTEN 전용 연결이 함께 사용)"""
+    return {
+        "host": os.getenv("DB_HOST"),
+        "port": int(os.getenv("DB_PORT")),
+        "database": os.getenv("DB_NAME"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "ssl": "require",
+    }
+
+def get_pool_options() -> dict:
+    """
+    환경 변수로부터 풀 크기/타임아웃 설정을 만든다.
+
+    - DB_POOL_MIN_SIZE: 시작할 때 미리 열어 두는 연결 수 (기본 2)
+    - DB_POOL_MAX_SIZE: 최대 연결 수 (기본 5)
+    - DB_POOL_ACQUIRE_TIMEOUT: 연결을 얻기까지 기다리는 최대 시간(초) (기본 10)
+    - DB_COMMAND_TIMEOUT: 쿼리 하나의 최대 실행 시간(초) (기본 30)
+    - DB_POOL_MAX_INACTIVE_LIFETIME: 쓰지 않는 연결을 닫기까지의 시간(초) (기본 300)
+    """
+    max_size = int(os.getenv("DB_POOL_MAX_SIZE", 5))
+    return {
+        "min_size": min(int(os.getenv("DB_POOL_MIN_SIZE", 2)), max_size),
+        "max_size": max_size,
+        "acquire_timeout": float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", 10)),
+        "command_timeout": float(os.getenv("DB_COMMAND_TIMEOUT", 30)),
+        "max_inactive_connection_lifetime": float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", 300)),
+    }
+
+
+class PoolMetrics:
+    """
+    DB 풀 사용량 지표.
+    연결 획득 대기 시간, 사용 중인 연결 수, SQL 문장별 실행 시간(asyncpg query logger)을 모은다.
+    """
+
+    def __init__(self):
+        self.acquire_count = 0
+        self.acquire_wait_total = 0.0
+        self.acquire_wait_max = 0.0
+        self.acquire_timeouts = 0
+        self.in_use = 0
+        self.in_use_max = 0
+        self.queries: dict[str, dict] = {}
+
+    def acquired(self, wait: float):
+        self.acquire_count += 1
+        self.acquire_wait_total += wait
+        self.acquire_wait_max = max(self.acquire_wait_max, wait)
+        self.in_use += 1
+        self.in_use_max = max(self.in_use_max, self.in_use)
+
+    def released(self):
+        self.in_use -= 1
+
+    def log_query(self, record):
+        """asyncpg Connection.add_query_logger 콜백. SQL 문장별 횟수/누적/최대 실행 시간을 기록한다."""
+        sql = " ".join(record.query.split())[:120]
+        stats = self.queries.get(sql)
+        if stats is None:
+            stats = {"count": 0, "total": 0.0, "max": 0.0, "errors": 0}
+            self.queries[sql] = stats
+        stats["count"] += 1
+        stats["total"] += record.elapsed
+        stats["max"] = max(stats["max"], record.elapsed)
+        if record.exception is not None:
+            stats["errors"] += 1
+
+    def snapshot(self, top: int = 3) -> dict:
+        """
+        현재 지표 요약을 반환한다.
+
+        Args:
+            top (int): 누적 실행 시간이 긴 순으로 포함할 SQL 문장 수
+
+        Returns:
+            dict: in_use, in_use_max, acquire_count, acquire_wait_avg, acquire_wait_max, acquire_timeouts, slow_queries
+        """
+        slow_queries = sorted(self.queries.items(), key=lambda item: item[1]["total"], reverse=True)[:top]
+        return {
+            "in_use": self.in_use,
+            "in_use_max": self.in_use_max,
+            "acquire_count": self.acquire_count,
+            "acquire_wait_avg": self.acquire_wait_total / self.acquire_count if self.acquire_count else 0.0,
+            "acquire_wait_max": self.acquire_wait_max,
+            "acquire_timeouts": self.acquire_timeouts,
+            "slow_queries": [
+                {"sql": sql, **stats, "avg": stats["total"] / stats["count"]}
+                for sql, stats in slow_queries
+            ],
+        }
+
+
+# 풀 사용량 지표 (get_pool()이 반환하는 풀이 기록)
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedPool:
+    """
+    asyncpg 풀을 감싸 acquire()의 대기 시간과 사용 중인 연결 수를 pool_metrics에 기록한다.
+    그 외 속성/메서드는 원래 풀에 그대로 위임한다.
+    """
+
+    def __init__(self, raw_pool: asyncpg.Pool, acquire_timeout: float, metrics: PoolMetrics):
+        self.raw_pool = raw_pool
+        self.acquire_timeout = acquire_timeout
+        self.metrics = metrics
+
+    @asynccontextmanager
+    async def acquire(self, timeout: float = None):
+        started = time.perf_counter()
+        try:
+            conn = await self.raw_pool.acquire(timeout=timeout or self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.metrics.acquire_timeouts += 1
+            raise
+        self.metrics.acquired(time.perf_counter() - started)
+        try:
+            yield conn
+        finally:
+            self.metrics.released()
+            await self.raw_pool.release(conn)
+
+    def __getattr__(self, name):
+        return getattr(self.raw_pool, name)
+
+
+async def _init_connection(conn) -> None:
+    """풀이 새 연결을 열 때마다 SQL 실행 시간 기록용 query logger를 등록한다."""
+    conn.add_query_logger(pool_metrics.log_query)
+
+async def check_pool_health(target=None) -> bool:
+    """풀에서 연결 하나를 얻어 SELECT 1을 실행한다. (target이 없으면 현재 풀)"""
+    try:
+        async with (target or pool).acquire() as conn:
+            return await conn.fetchval("SELECT 1") == 1
+    except (asyncpg.PostgresError, OSError, asyncio.TimeoutError) as e:
+        print(f"❌ DB 헬스 체크 실패: {e}")
+        return False
 
 async def connect_db():
+    """
+    환경 변수 설정으로 풀을 만들고(min_size개 연결을 미리 엶), 스키마 적용과 헬스 체크를 실행한다.
+    """
     global pool
+    options = get_pool_options()
+    acquire_timeout = options.pop("acquire_timeout")
+    new_pool = None
     try:
-        pool = await asyncpg.create_pool(
-            host=os.getenv("DB_HOST"),
-            port=int(os.getenv("DB_PORT")),
-            database=os.getenv("DB_NAME"),
-            user=os.getenv("DB_USER"),
-            password=os.getenv("DB_PASSWORD"),
-            ssl="require",
-            min_size=1,
-            max_size=5,
+        raw_pool = await asyncpg.create_pool(
+            **get_connect_options(),
+            **options,
+            init=_init_connection,
         )
-        print("✅ DB 풀 생성 완료")
+        new_pool = InstrumentedPool(raw_pool, acquire_timeout, pool_metrics)
+        async with new_pool.acquire() as conn:
+            await apply_schema(conn)
+        if not await check_pool_health(new_pool):
+            raise RuntimeError("DB 헬스 체크 실패")
+        pool = new_pool
+        print(f"✅ DB 풀 생성 완료 (연결 {options['min_size']}~{options['max_size']}개, 획득 타임아웃 {acquire_timeout}초)")
     except Exception as e:
         print(f"❌ DB 풀 생성 실패: {e}")
-        raise 
+        if new_pool is not None:
+            await new_pool.raw_pool.close()
+        raise
 
 async def ensure_pool():
-    """풀(pool)이 없으면 connect_db()를 호출해 초기화한다."""
-    global pool
-    if pool is None:
-        await connect_db()
+    """풀(pool)이 없으면 connect_db()를 호출해 초기화한다. (동시에 호출돼도 풀은 하나만 생성)"""
+    if pool is not None:
+        return
+    async with _pool_lock:
+        if pool is None:
+            await connect_db()
 
 def get_pool():
     """DB 풀을 반환한다."""
-    return pool 
\ No newline at end of file
+    return pool
+
+def get_pool_metrics() -> dict:
+    """DB 풀 사용량 지표 요약을 반환한다. (PoolMetrics.snapshot 참고)"""
+    return pool_metrics.snapshot()
@@ -0,0 +1,140 @@
+import time
+import asyncio
+import asyncpg
+from .connection import ensure_pool, get_pool
+
+SQL_INSERT_DELIVERIES = """
+    INSERT INTO news_delivery (channel_id, article_key, created_at)
+    SELECT * FROM unnest($1::bigint[], $2::text[], $3::bigint[])
+    ON CONFLICT (channel_id, article_key) DO NOTHING
+"""
+SQL_SELECT_DELIVERIES = "SELECT channel_id, article_key FROM news_delivery WHERE article_key = ANY($1::text[])"
+SQL_DELETE_OLD_DELIVERIES = "DELETE FROM news_delivery WHERE created_at < $1"
+
+async def save_deliveries(rows: list[tuple[int, str, int]]) -> bool:
+    """
+    (채널 ID, 기사 식별자, 기사 createdAt) 전송 기록을 한 문장으로 저장한다.
+
+    Args:
+        rows (list[tuple[int, str, int]]): 전송 기록 목록
+
+    Returns:
+        bool: 성공 여부
+    """
+    if not rows:
+        return True
+
+    channel_ids, article_keys, created_ats = (list(column) for column in zip(*rows))
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(SQL_INSERT_DELIVERIES, channel_ids, article_keys, created_ats)
+        return True
+    except asyncpg.PostgresError as e:
+        print(f"❌ save_deliveries 오류: {e}")
+        return False
+
+async def load_deliveries(article_keys: list[str]) -> set[tuple[int, str]]:
+    """
+    해당 기사들이 이미 전송된 (채널 ID, 기사 식별자) 목록을 가져온다.
+
+    Args:
+        article_keys (list[str]): 기사 식별자 목록
+
+    Returns:
+        set: (채널 ID, 기사 식별자) 집합 (오류 시 빈 집합)
+    """
+    if not article_keys:
+        return set()
+
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(SQL_SELECT_DELIVERIES, list(article_keys))
+            return {(row["channel_id"], row["article_key"]) for row in rows}
+    except asyncpg.PostgresError as e:
+        print(f"❌ load_deliveries 오류: {e}")
+        return set()
+
+async def prune_deliveries(before_ms: int) -> None:
+    """
+    createdAt이 before_ms보다 오래된 기사의 전송 기록을 삭제한다.
+
+    Args:
+        before_ms (int): 기준 시각 (epoch ms)
+    """
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(SQL_DELETE_OLD_DELIVERIES, before_ms)
+    except asyncpg.PostgresError as e:
+        print(f"❌ prune_deliveries 오류: {e}")
+
+
+class DeliveryLedger:
+    """
+    채널별 기사 전송 기록(원장).
+
+    - 전송에 성공한 (채널, 기사)를 메모리에 모았다가 batch_size건마다 한 번에 기록한다.
+    - 다음 사이클(또는 재시작/재연결 후 사이클)은 delivered()로 이미 보낸 조합을 걸러, 빠진 것만 전송한다.
+    - retention_hours가 지난 기사의 기록은 prune_interval초마다 정리한다.
+    """
+
+    def __init__(self, batch_size: int = 500, retention_hours: float = 72, prune_interval: float = 3600, load=None, save=None, prune=None):
+        # 저장소 백엔드의 load_deliveries / save_deliveries / prune_deliveries (기본값: Postgres)
+        self.load_rows = load or load_deliveries
+        self.save_rows = save or save_deliveries
+        self.prune_rows = prune or prune_deliveries
+        self.batch_size = batch_size
+        self.retention_ms = int(retention_hours * 3600 * 1000)
+        self.prune_interval = prune_interval
+        self.buffer: list[tuple[int, str, int]] = []
+        self.last_pruned_at = 0.0
+        self.lock = asyncio.Lock()
+
+    async def delivered(self, article_keys: list[str]) -> set[tuple[int, str]]:
+        """
+        해당 기사들이 이미 전송된 (채널 ID, 기사 식별자) 집합을 반환한다. (아직 기록되지 않은 버퍼 포함)
+        """
+        keys = set(article_keys)
+        done = await self.load_rows(list(keys))
+        done.update((channel_id, key) for channel_id, key, _ in self.buffer if key in keys)
+        return done
+
+    async def record(self, channel_id: int, entries: list[tuple[str, int]]) -> None:
+        """
+        채널 하나에 전송한 기사들을 기록한다. 버퍼가 batch_size를 넘으면 바로 기록한다.
+
+        Args:
+            channel_id (int): 채널 ID
+            entries (list[tuple[str, int]]): (기사 식별자, 기사 createdAt) 목록
+        """
+        self.buffer.extend((channel_id, key, created_at) for key, created_at in entries)
+        if len(self.buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """
+        버퍼에 모인 전송 기록을 한 번에 기록한다. 실패하면 버퍼에 되돌려 다음 flush에서 다시 기록한다.
+
+        Returns:
+            bool: 성공 여부 (기록할 내용이 없으면 True)
+        """
+        async with self.lock:
+            rows, self.buffer = self.buffer, []
+            if rows and not await self.save_rows(rows):
+                self.buffer[:0] = rows
+                return False
+
+            now = time.time()
+            if now - self.last_pruned_at >= self.prune_interval:
+                self.last_pruned_at = now
+                await self.prune_rows(int(now * 1000) - self.retention_ms)
+            return True
+
+
+# 뉴스 루프가 사용하는 전송 기록
+delivery_ledger = DeliveryLedger()
@@ -3,6 +3,11 @@ from .connection import ensure_pool, get_pool
 
 SQL_UPDATE_NEWS_STATE = "UPDATE news_state SET last_processed_at = $1 WHERE game = $2"
 SQL_SELECT_NEWS_STATE = "SELECT game, last_processed_at FROM news_state"
+SQL_UPDATE_NEWS_STATES = """
+    UPDATE news_state AS s SET last_processed_at = v.last_at
+    FROM unnest($1::text[], $2::bigint[]) AS v(game, last_at)
+    WHERE s.game = v.game
+"""
 
 async def save_state(game: str, last_at: int) -> None:
     """
@@ -48,4 +53,96 @@ async def update_state(game: str, articles: list[dict]) -> None:
     if not articles:
         return
     max_at = max([article.get('createdAt', 0) for article in articles])
-    await save_state(game, max_at) 
\ No newline at end of file
+    await save_state(game, max_at) 
+
+async def save_states(states: dict[str, int]) -> bool:
+    """
+    여러 game의 lastProcessedAt을 한 트랜잭션(한 문장)으로 기록한다.
+
+    Args:
+        states (dict[str, int]): game → 알림으로 남긴 마지막 기사의 createdAt 값
+
+    Returns:
+        bool: 성공 여부 (실패 시 어떤 game도 기록되지 않음)
+    """
+    if not states:
+        return True
+
+    await ensure_pool()
+    try:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(SQL_UPDATE_NEWS_STATES, list(states), list(states.values()))
+        return True
+    except asyncpg.PostgresError as e:
+        print(f"❌ save_states 오류: {e}")
+        return False
+
+
+class NewsStateStore:
+    """
+    game별 lastProcessedAt을 메모리에 들고 있는 뉴스 상태 저장소.
+
+    - 처음 한 번만 DB에서 읽고, 이후 조회는 메모리에서 처리한다.
+    - 한 사이클 동안 stage()로 변경을 모아 두었다가 commit()에서 한 트랜잭션으로 기록한다.
+      DB 쓰기 횟수는 바뀐 게임 수와 관계없이 사이클당 최대 한 번이다.
+    """
+
+    def __init__(self, load=None, save=None):
+        # 저장소 백엔드의 load_state / save_states (기본값: Postgres)
+        self.load_rows = load or load_state
+        self.save_rows = save or save_states
+        self.state: dict[str, int] = {}
+        self.pending: dict[str, int] = {}
+        self.loaded = False
+
+    async def load(self) -> dict[str, int]:
+        """
+        game별 lastProcessedAt을 반환한다. 아직 로드하지 않았다면 DB에서 한 번 읽는다.
+        커밋되지 않은 변경(pending)도 반영된 값이다.
+        DB에서 읽지 못했으면 loaded가 False로 남으므로, 호출 측은 이 값을 워터마크로 쓰면 안 된다.
+        """
+        if not self.loaded:
+            rows = await self.load_rows()
+            if rows:
+                self.state = rows
+                self.loaded = True
+        return {**self.state, **self.pending}
+
+    def stage(self, game: str, articles: list[dict]) -> None:
+        """
+        전송한 기사 중 가장 최신 createdAt을 game의 다음 lastProcessedAt으로 올려 둔다. (DB 기록은 commit에서)
+
+        Args:
+            game (str): 롤/발로란트/오버워치 key 값
+            articles (List[Dict]): 전송한 기사 목록
+        """
+        if not articles:
+            return
+        max_at = max(article.get('createdAt', 0) for article in articles)
+        current = self.pending.get(game, self.state.get(game, 0))
+        if max_at > current:
+            self.pending[game] = max_at
+
+    async def commit(self) -> bool:
+        """
+        stage된 모든 game의 lastProcessedAt을 한 트랜잭션으로 기록한다.
+        실패하면 pending을 그대로 두어 다음 사이클의 commit에서 다시 기록한다.
+
+        Returns:
+            bool: 성공 여부 (기록할 변경이 없으면 True)
+        """
+        if not self.pending:
+            return True
+        pending = dict(self.pending)
+        if not await self.save_rows(pending):
+            return False
+        self.state.update(pending)
+        for game, last_at in pending.items():
+            if self.pending.get(game) == last_at:
+                del self.pending[game]
+        return True
+
+
+# 뉴스 루프가 사용하는 뉴스 상태 저장소
+news_state = NewsStateStore()
@@ -0,0 +1,102 @@
+# 봇이 추가로 사용하는 테이블/컬럼 DDL (IF NOT EXISTS로 작성해 매 시작마다 실행해도 안전)
+POSTGRES_SCHEMA = [
+    # 채널별 뉴스 묶음 전송 여부 (True면 최대 10개 임베드를 한 메시지로 전송)
+    "ALTER TABLE news_channel ADD COLUMN IF NOT EXISTS batch_mode BOOLEAN NOT NULL DEFAULT FALSE",
+    # 유니크 인덱스를 만들기 전에 channel_id가 중복된 행을 정리 (기존 테이블에는 유니크 제약이 없었음)
+    # 작성 시각 컬럼이 없으므로 물리적으로 가장 나중에 기록된 행(ctid가 가장 큰 행)을 남김
+    """
+    DELETE FROM news_channel AS older
+    USING news_channel AS newer
+    WHERE older.channel_id = newer.channel_id AND older.ctid < newer.ctid
+    """,
+    # 채널 설정 upsert(ON CONFLICT)의 대상 키
+    "CREATE UNIQUE INDEX IF NOT EXISTS news_channel_channel_id_uidx ON news_channel (channel_id)",
+    # 채널별 기사 전송 기록 (중단된 전송을 재개할 때 이미 보낸 기사는 건너뛰기 위함)
+    """
+    CREATE TABLE IF NOT EXISTS news_delivery (
+        channel_id BIGINT NOT NULL,
+        article_key TEXT NOT NULL,
+        created_at BIGINT NOT NULL,
+        PRIMARY KEY (channel_id, article_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS news_delivery_article_key_idx ON news_delivery (article_key)",
+    "CREATE INDEX IF NOT EXISTS news_delivery_created_at_idx ON news_delivery (created_at)",
+    # 크롤링한 기사 아카이브 (/뉴스확인의 지난 날짜 조회용)
+    """
+    CREATE TABLE IF NOT EXISTS news_article (
+        game TEXT NOT NULL,
+        article_key TEXT NOT NULL,
+        created_at BIGINT NOT NULL,
+        title TEXT,
+        sub_content TEXT,
+        link_url TEXT,
+        thumbnail TEXT,
+        PRIMARY KEY (game, article_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS news_article_game_created_at_idx ON news_article (game, created_at)",
+    # 기사를 모두 아카이브한 (게임, KST 날짜) → 이 날짜는 네이버에 다시 요청하지 않음
+    """
+    CREATE TABLE IF NOT EXISTS news_archive_day (
+        game TEXT NOT NULL,
+        day DATE NOT NULL,
+        PRIMARY KEY (game, day)
+    )
+    """,
+]
+
+# 내장 SQLite 백엔드의 전체 스키마 (Postgres의 news_state / news_channel 테이블 포함)
+SQLITE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS news_state (
+        game TEXT PRIMARY KEY,
+        last_processed_at INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "INSERT OR IGNORE INTO news_state (game) VALUES ('lol'), ('valorant'), ('overwatch')",
+    """
+    CREATE TABLE IF NOT EXISTS news_channel (
+        channel_id INTEGER PRIMARY KEY,
+        lol INTEGER NOT NULL DEFAULT 0,
+        valorant INTEGER NOT NULL DEFAULT 0,
+        overwatch INTEGER NOT NULL DEFAULT 0,
+        batch_mode INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS news_delivery (
+        channel_id INTEGER NOT NULL,
+        article_key TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        PRIMARY KEY (channel_id, article_key)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS news_delivery_article_key_idx ON news_delivery (article_key)",
+    "CREATE INDEX IF NOT EXISTS news_delivery_created_at_idx ON news_delivery (created_at)",
+    """
+    CREATE TABLE IF NOT EXISTS news_article (
+        game TEXT NOT NULL,
+        article_key TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        title TEXT,
+        sub_content TEXT,
+        link_url TEXT,
+        thumbnail TEXT,
+        PRIMARY KEY (game, article_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS news_article_game_created_at_idx ON news_article (game, created_at)",
+    """
+    CREATE TABLE IF NOT EXISTS news_archive_day (
+        game TEXT NOT NULL,
+        day TEXT NOT NULL,
+        PRIMARY KEY (game, day)
+    ) WITHOUT ROWID
+    """,
+]
+
+async def apply_schema(conn) -> None:
+    """POSTGRES_SCHEMA의 DDL을 순서대로 실행한다."""
+    for statement in POSTGRES_SCHEMA:
+        await conn.execute(statement)
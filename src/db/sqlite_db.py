@@ -0,0 +1,466 @@
+import os
+import time
+import asyncio
+import sqlite3
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from .schema import SQLITE_SCHEMA
+from .connection import PoolMetrics
+from .news_db import NewsStateStore
+from .delivery_db import DeliveryLedger
+
+# 내장 SQLite 백엔드 (DB_BACKEND=sqlite)
+# 단일 노드 배포/테스트용. Postgres 백엔드와 같은 함수 이름과 반환 형식을 제공한다.
+# 연결 하나를 전용 스레드 하나에서만 사용하므로 요청은 순서대로 처리되고, WAL 모드라 읽기가 쓰기를 막지 않는다.
+
+SQL_SELECT_NEWS_STATE = "SELECT game, last_processed_at FROM news_state"
+SQL_UPDATE_NEWS_STATE = "UPDATE news_state SET last_processed_at = ? WHERE game = ?"
+
+SQL_UPSERT_CHANNEL_STATE = """
+    INSERT INTO news_channel (channel_id, lol, valorant, overwatch) VALUES (?, ?, ?, ?)
+    ON CONFLICT (channel_id) DO UPDATE SET lol = excluded.lol, valorant = excluded.valorant, overwatch = excluded.overwatch
+"""
+SQL_UPSERT_CHANNEL_STATES = """
+    INSERT INTO news_channel (channel_id, lol, valorant, overwatch, batch_mode) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (channel_id) DO UPDATE SET
+        lol = excluded.lol, valorant = excluded.valorant, overwatch = excluded.overwatch, batch_mode = excluded.batch_mode
+"""
+SQL_UPDATE_CHANNEL_BATCH_MODE = "UPDATE news_channel SET batch_mode = ? WHERE channel_id = ?"
+SQL_DELETE_CHANNEL_STATE = "DELETE FROM news_channel WHERE channel_id = ?"
+SQL_SELECT_CHANNEL_STATE = "SELECT channel_id, lol, valorant, overwatch, batch_mode FROM news_channel WHERE channel_id = ?"
+SQL_SELECT_ALL_CHANNEL_STATE = "SELECT channel_id, lol, valorant, overwatch, batch_mode FROM news_channel"
+
+SQL_INSERT_DELIVERY = "INSERT OR IGNORE INTO news_delivery (channel_id, article_key, created_at) VALUES (?, ?, ?)"
+SQL_SELECT_DELIVERIES = "SELECT channel_id, article_key FROM news_delivery WHERE article_key IN ({})"
+SQL_DELETE_OLD_DELIVERIES = "DELETE FROM news_delivery WHERE created_at < ?"
+
+SQL_UPSERT_ARTICLE = """
+    INSERT INTO news_article (game, article_key, created_at, title, sub_content, link_url, thumbnail) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (game, article_key) DO UPDATE SET
+        title = excluded.title, sub_content = excluded.sub_content, thumbnail = excluded.thumbnail
+"""
+SQL_SELECT_ARTICLES = """
+    SELECT game, created_at, title, sub_content, link_url, thumbnail FROM news_article
+    WHERE game IN ({}) AND created_at >= ? AND created_at < ?
+    ORDER BY created_at DESC
+"""
+SQL_INSERT_ARCHIVE_DAY = "INSERT OR IGNORE INTO news_archive_day (game, day) VALUES (?, ?)"
+SQL_SELECT_ARCHIVE_DAYS = "SELECT game, day FROM news_archive_day WHERE game IN ({}) AND day BETWEEN ? AND ?"
+
+# IN (...) 하나에 넣는 최대 파라미터 수
+MAX_IN_PARAMS = 500
+
+_conn = None
+_conn_lock = asyncio.Lock()
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+
+# asyncpg LoggedQuery와 같은 필드 이름 (PoolMetrics.log_query에 그대로 전달)
+_QueryRecord = namedtuple("_QueryRecord", ["query", "elapsed", "exception"])
+
+# SQLite 사용량 지표 (전용 스레드 대기 시간 = 획득 대기 시간)
+pool_metrics = PoolMetrics()
+
+# 기본 DB 파일 경로 (작업 디렉터리가 아닌 사용자 홈 아래 → 비루트 유저로 실행되는 컨테이너에서도 쓰기 가능)
+DEFAULT_SQLITE_PATH = Path.home() / ".local" / "share" / "rgl-news-bot" / "news_bot.db"
+
+def get_sqlite_path() -> Path:
+    """환경 변수 SQLITE_PATH로 DB 파일 경로를 정한다. (기본 ~/.local/share/rgl-news-bot/news_bot.db)"""
+    return Path(os.getenv("SQLITE_PATH") or DEFAULT_SQLITE_PATH)
+
+def _open_connection() -> sqlite3.Connection:
+    path = get_sqlite_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    for statement in SQLITE_SCHEMA:
+        conn.execute(statement)
+    return conn
+
+def _execute(conn: sqlite3.Connection, sql: str, params=(), many: bool = False) -> sqlite3.Cursor:
+    """SQL 하나를 실행하고 실행 시간을 pool_metrics에 기록한다."""
+    started = time.perf_counter()
+    exception = None
+    try:
+        return conn.executemany(sql, params) if many else conn.execute(sql, params)
+    except sqlite3.Error as e:
+        exception = e
+        raise
+    finally:
+        pool_metrics.log_query(_QueryRecord(sql, time.perf_counter() - started, exception))
+
+def _fetch(conn: sqlite3.Connection, sql: str, params=()) -> list:
+    return _execute(conn, sql, params).fetchall()
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+async def _run(work, *args):
+    """work(conn, *args)를 SQLite 전용 스레드에서 실행한다."""
+    await ensure_pool()
+    queued_at = time.perf_counter()
+
+    def call():
+        pool_metrics.acquired(time.perf_counter() - queued_at)
+        try:
+            return work(_conn, *args)
+        finally:
+            pool_metrics.released()
+
+    return await asyncio.get_running_loop().run_in_executor(_executor, call)
+
+def _chunks(values: list, size: int = MAX_IN_PARAMS):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+def _placeholders(count: int) -> str:
+    return ", ".join("?" * count)
+
+def _row_state(row) -> dict:
+    return {
+        "channel_id": row["channel_id"],
+        "lol": bool(row["lol"]),
+        "valorant": bool(row["valorant"]),
+        "overwatch": bool(row["overwatch"]),
+        "batch_mode": bool(row["batch_mode"]),
+    }
+
+def _channel_row(channel_id: int, state: dict) -> tuple:
+    return (channel_id, *(bool(state.get(key, False)) for key in ("lol", "valorant", "overwatch", "batch_mode")))
+
+
+# ---- 연결 관리 ----
+
+async def connect_db():
+    """SQLite 파일을 WAL 모드로 열고 스키마를 적용한다."""
+    global _conn
+    try:
+        _conn = await asyncio.get_running_loop().run_in_executor(_executor, _open_connection)
+        print(f"✅ SQLite 연결 완료 ({get_sqlite_path()}, WAL)")
+    except sqlite3.Error as e:
+        print(f"❌ SQLite 연결 실패: {e}")
+        raise
+
+async def ensure_pool():
+    """연결이 없으면 connect_db()를 호출해 초기화한다."""
+    if _conn is not None:
+        return
+    async with _conn_lock:
+        if _conn is None:
+            await connect_db()
+
+def get_pool():
+    """SQLite 연결을 반환한다."""
+    return _conn
+
+def get_pool_metrics() -> dict:
+    """SQLite 사용량 지표 요약을 반환한다. (PoolMetrics.snapshot 참고)"""
+    return pool_metrics.snapshot()
+
+async def check_pool_health() -> bool:
+    """SELECT 1을 실행한다."""
+    try:
+        return await _run(lambda conn: _fetch(conn, "SELECT 1")[0][0] == 1)
+    except sqlite3.Error as e:
+        print(f"❌ DB 헬스 체크 실패: {e}")
+        return False
+
+
+# ---- 뉴스 상태 ----
+
+async def save_state(game: str, last_at: int) -> None:
+    """game별 lastProcessedAt을 기록한다."""
+    try:
+        await _run(lambda conn: _execute(conn, SQL_UPDATE_NEWS_STATE, (last_at, game)))
+    except sqlite3.Error as e:
+        print(f"❌ save_state 오류: {e}")
+
+async def save_states(states: dict[str, int]) -> bool:
+    """여러 game의 lastProcessedAt을 한 트랜잭션으로 기록한다."""
+    if not states:
+        return True
+
+    def work(conn):
+        with _transaction(conn):
+            _execute(conn, SQL_UPDATE_NEWS_STATE, [(last_at, game) for game, last_at in states.items()], many=True)
+
+    try:
+        await _run(work)
+        return True
+    except sqlite3.Error as e:
+        print(f"❌ save_states 오류: {e}")
+        return False
+
+async def load_state() -> dict[str, int]:
+    """game별 lastProcessedAt을 가져온다."""
+    try:
+        rows = await _run(_fetch, SQL_SELECT_NEWS_STATE)
+        return {row["game"]: row["last_processed_at"] for row in rows}
+    except sqlite3.Error as e:
+        print(f"❌ load_state 오류: {e}")
+        return {}
+
+async def update_state(game: str, articles: list[dict]) -> None:
+    """기사 목록의 가장 최신 createdAt으로 game의 lastProcessedAt을 최신화한다."""
+    if not articles:
+        return
+    await save_state(game, max(article.get('createdAt', 0) for article in articles))
+
+# 뉴스 루프가 사용하는 뉴스 상태 저장소
+news_state = NewsStateStore(load=load_state, save=save_states)
+
+
+# ---- 기사 전송 기록 ----
+
+async def save_deliveries(rows: list[tuple[int, str, int]]) -> bool:
+    """(채널 ID, 기사 식별자, 기사 createdAt) 전송 기록을 한 트랜잭션으로 저장한다."""
+    if not rows:
+        return True
+
+    def work(conn):
+        with _transaction(conn):
+            _execute(conn, SQL_INSERT_DELIVERY, rows, many=True)
+
+    try:
+        await _run(work)
+        return True
+    except sqlite3.Error as e:
+        print(f"❌ save_deliveries 오류: {e}")
+        return False
+
+async def load_deliveries(article_keys: list[str]) -> set[tuple[int, str]]:
+    """해당 기사들이 이미 전송된 (채널 ID, 기사 식별자) 집합을 가져온다."""
+    if not article_keys:
+        return set()
+
+    def work(conn):
+        delivered = set()
+        for chunk in _chunks(list(article_keys)):
+            rows = _fetch(conn, SQL_SELECT_DELIVERIES.format(_placeholders(len(chunk))), chunk)
+            delivered.update((row["channel_id"], row["article_key"]) for row in rows)
+        return delivered
+
+    try:
+        return await _run(work)
+    except sqlite3.Error as e:
+        print(f"❌ load_deliveries 오류: {e}")
+        return set()
+
+async def prune_deliveries(before_ms: int) -> None:
+    """createdAt이 before_ms보다 오래된 기사의 전송 기록을 삭제한다."""
+    try:
+        await _run(lambda conn: _execute(conn, SQL_DELETE_OLD_DELIVERIES, (before_ms,)))
+    except sqlite3.Error as e:
+        print(f"❌ prune_deliveries 오류: {e}")
+
+# 뉴스 루프가 사용하는 전송 기록
+delivery_ledger = DeliveryLedger(load=load_deliveries, save=save_deliveries, prune=prune_deliveries)
+
+
+# ---- 기사 아카이브 ----
+
+async def save_articles(articles_by_game: dict[str, list[dict]]) -> bool:
+    """크롤링한 기사를 아카이브에 저장한다. 이미 있는 기사는 내용만 갱신한다."""
+    rows = [
+        (
+            game,
+            article.get("linkUrl") or f"{article.get('title') or ''}@{article['createdAt']}",
+            article["createdAt"],
+            article.get("title"),
+            article.get("subContent"),
+            article.get("linkUrl"),
+            article.get("thumbnail"),
+        )
+        for game, articles in articles_by_game.items()
+        for article in articles
+    ]
+    if not rows:
+        return True
+
+    def work(conn):
+        with _transaction(conn):
+            _execute(conn, SQL_UPSERT_ARTICLE, rows, many=True)
+
+    try:
+        await _run(work)
+        return True
+    except sqlite3.Error as e:
+        print(f"❌ save_articles 오류: {e}")
+        return False
+
+async def load_articles(games: list[str], start_ms: int, end_ms: int) -> dict[str, list[dict]]:
+    """아카이브에서 createdAt이 [start_ms, end_ms) 범위인 기사를 game별로 가져온다. (최신순)"""
+    sql = SQL_SELECT_ARTICLES.format(_placeholders(len(games)))
+    try:
+        rows = await _run(_fetch, sql, (*games, start_ms, end_ms))
+    except sqlite3.Error as e:
+        print(f"❌ load_articles 오류: {e}")
+        return {}
+
+    articles = {game: [] for game in games}
+    for row in rows:
+        articles[row["game"]].append({
+            "title": row["title"],
+            "subContent": row["sub_content"],
+            "linkUrl": row["link_url"],
+            "thumbnail": row["thumbnail"],
+            "createdAt": row["created_at"],
+        })
+    return articles
+
+async def mark_archive_days(days: list[tuple[str, date]]) -> bool:
+    """(game, 날짜)의 기사를 모두 아카이브에 저장했다고 기록한다."""
+    if not days:
+        return True
+
+    def work(conn):
+        with _transaction(conn):
+            _execute(conn, SQL_INSERT_ARCHIVE_DAY, [(game, day.isoformat()) for game, day in days], many=True)
+
+    try:
+        await _run(work)
+        return True
+    except sqlite3.Error as e:
+        print(f"❌ mark_archive_days 오류: {e}")
+        return False
+
+async def load_archive_days(games: list[str], start: date, end: date) -> set[tuple[str, date]]:
+    """[start, end] 범위에서 아카이브가 완료된 (game, 날짜) 집합을 가져온다."""
+    sql = SQL_SELECT_ARCHIVE_DAYS.format(_placeholders(len(games)))
+    try:
+        rows = await _run(_fetch, sql, (*games, start.isoformat(), end.isoformat()))
+        return {(row["game"], date.fromisoformat(row["day"])) for row in rows}
+    except sqlite3.Error as e:
+        print(f"❌ load_archive_days 오류: {e}")
+        return set()
+
+
+# ---- 채널 설정 ----
+
+async def warm_channel_cache() -> int:
+    """SQLite는 로컬 조회라 별도 캐시가 없다. 호환을 위해 설정된 채널 수만 반환한다."""
+    return len(await load_all_channel_state())
+
+async def save_channel_state(channel_id: int, games: dict[str, bool]) -> bool:
+    """해당 채널의 게임 뉴스 설정값(롤, 발로란트, 오버워치)을 저장한다. (묶음 전송 여부는 유지)"""
+    params = (channel_id, bool(games["lol"]), bool(games["valorant"]), bool(games["overwatch"]))
+    try:
+        await _run(lambda conn: _execute(conn, SQL_UPSERT_CHANNEL_STATE, params))
+        return True
+    except sqlite3.Error as e:
+        print(f"❌ save_channel_state 오류: {e}")
+        return False
+
+async def save_channel_states(states: dict[int, dict[str, bool]]) -> bool:
+    """여러 채널의 설정값을 한 트랜잭션으로 저장한다. batch_mode가 없으면 False로 저장한다."""
+    if not states:
+        return True
+
+    def work(conn):
+        with _transaction(conn):
+            _execute(conn, SQL_UPSERT_CHANNEL_STATES, [_channel_row(cid, state) for cid, state in states.items()], many=True)
+
+    try:
+        await _run(work)
+        return True
+    except sqlite3.Error as e:
+        print(f"❌ save_channel_states 오류: {e}")
+        return False
+
+async def load_channel_state(channel_id: int) -> dict[str, bool]:
+    """해당 채널의 게임 뉴스 설정값(롤, 발로란트, 오버워치, 묶음 전송 여부)을 로드한다."""
+    try:
+        rows = await _run(_fetch, SQL_SELECT_CHANNEL_STATE, (channel_id,))
+    except sqlite3.Error as e:
+        print(f"❌ load_channel_state 오류: {e}")
+        return {}
+    if not rows:
+        return {}
+    return {key: value for key, value in _row_state(rows[0]).items() if key != "channel_id"}
+
+async def load_channel_states(channel_ids: list[int]) -> dict[int, dict[str, bool]]:
+    """여러 채널의 설정값을 한 번에 로드한다. (설정이 없는 채널은 제외)"""
+    def work(conn):
+        states = {}
+        for chunk in _chunks(list(channel_ids)):
+            sql = f"{SQL_SELECT_ALL_CHANNEL_STATE} WHERE channel_id IN ({_placeholders(len(chunk))})"
+            states.update((row["channel_id"], _row_state(row)) for row in _fetch(conn, sql, chunk))
+        return states
+
+    try:
+        return await _run(work)
+    except sqlite3.Error as e:
+        print(f"❌ load_channel_states 오류: {e}")
+        return {}
+
+async def load_all_channel_state() -> dict[int, dict[str, bool]]:
+    """모든 채널의 게임 뉴스 설정값을 로드한다."""
+    try:
+        rows = await _run(_fetch, SQL_SELECT_ALL_CHANNEL_STATE)
+        return {row["channel_id"]: _row_state(row) for row in rows}
+    except sqlite3.Error as e:
+        print(f"❌ load_all_channel_state 오류: {e}")
+        return {}
+
+async def save_channel_batch_mode(channel_id: int, enabled: bool) -> bool:
+    """해당 채널의 뉴스 묶음 전송 여부를 저장한다. (뉴스 설정이 없는 채널이면 False)"""
+    try:
+        cursor = await _run(lambda conn: _execute(conn, SQL_UPDATE_CHANNEL_BATCH_MODE, (bool(enabled), channel_id)))
+        return cursor.rowcount > 0
+    except sqlite3.Error as e:
+        print(f"❌ save_channel_batch_mode 오류: {e}")
+        return False
+
+async def delete_channel_state(channel_id: int) -> bool:
+    """해당 채널의 게임 뉴스 설정값을 삭제한다. (삭제할 데이터가 없으면 False)"""
+    return await delete_channel_states([channel_id]) > 0
+
+async def delete_channel_states(channel_ids: list[int]) -> int:
+    """여러 채널의 게임 뉴스 설정값을 한 트랜잭션으로 삭제하고, 삭제된 채널 수를 반환한다."""
+    if not channel_ids:
+        return 0
+
+    def work(conn):
+        with _transaction(conn):
+            return _execute(conn, SQL_DELETE_CHANNEL_STATE, [(cid,) for cid in channel_ids], many=True).rowcount
+
+    try:
+        return await _run(work)
+    except sqlite3.Error as e:
+        print(f"❌ delete_channel_states 오류: {e}")
+        return 0
+
+async def export_guild_channel_states(channel_ids: list[int]) -> dict[int, dict[str, bool]]:
+    """서버(길드) 하나의 채널 설정값을 한 번에 내보낸다."""
+    return await load_channel_states(channel_ids)
+
+async def import_guild_channel_states(channel_ids: list[int], states: dict[int, dict[str, bool]]) -> bool:
+    """서버(길드) 하나의 채널 설정값을 한 트랜잭션으로 통째로 교체한다."""
+    removed = [(cid,) for cid in channel_ids if cid not in states]
+    upserts = [_channel_row(cid, state) for cid, state in states.items()]
+
+    def work(conn):
+        with _transaction(conn):
+            if removed:
+                _execute(conn, SQL_DELETE_CHANNEL_STATE, removed, many=True)
+            if upserts:
+                _execute(conn, SQL_UPSERT_CHANNEL_STATES, upserts, many=True)
+
+    try:
+        await _run(work)
+        return True
+    except sqlite3.Error as e:
+        print(f"❌ import_guild_channel_states 오류: {e}")
+        return False
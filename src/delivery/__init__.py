@@ -0,0 +1,35 @@
+# 뉴스 전송 엔진
+from .fanout import NewsFanout, RateBucket, batch_embeds
+
+# 뉴스 임베드 렌더 캐시
+from .embed_cache import EmbedCache, article_key, news_embed_cache, render_news_embed, render_news_page_embed
+
+# 구독 조합 인덱스
+from .subscriptions import GAMES, SubscriptionIndex, subscription_combo
+
+# 진행 중인 경기 점수 추적
+from .live_scores import LiveScoreTracker, match_key, score_state
+
+__all__ = [
+    # 뉴스 전송 엔진
+    "NewsFanout",
+    "RateBucket",
+    "batch_embeds",
+
+    # 뉴스 임베드 렌더 캐시
+    "EmbedCache",
+    "article_key",
+    "news_embed_cache",
+    "render_news_embed",
+    "render_news_page_embed",
+
+    # 구독 조합 인덱스
+    "GAMES",
+    "SubscriptionIndex",
+    "subscription_combo",
+
+    # 진행 중인 경기 점수 추적
+    "LiveScoreTracker",
+    "match_key",
+    "score_state",
+]
@@ -0,0 +1,134 @@
+import time
+import pytz
+import discord
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple
+
+KST = pytz.timezone("Asia/Seoul")
+
+
+def article_key(article: Dict[str, Any]) -> str:
+    """
+    기사를 구분하는 식별자를 반환한다. (linkUrl, 없으면 제목과 작성 시각)
+
+    Args:
+        article (Dict): 네이버 뉴스 API의 기사 dict
+
+    Returns:
+        str: 기사 식별자
+    """
+    return article.get("linkUrl") or f"{article.get('title')}@{article.get('createdAt')}"
+
+
+def render_news_embed(article: Dict[str, Any]) -> discord.Embed:
+    """자동 전송용 뉴스 임베드를 만든다. (제목, 요약, 썸네일, 발행시간)"""
+    embed = discord.Embed(
+        title=article.get('title'),
+        description=article.get('subContent'),
+        url=article.get('linkUrl'),
+        timestamp=datetime.fromtimestamp(article["createdAt"] / 1000, tz=pytz.UTC),
+        color=0x1E90FF
+    )
+
+    if article['thumbnail']:
+        embed.set_thumbnail(url=article['thumbnail'])
+
+    dt = datetime.fromtimestamp(article['createdAt'] / 1000, tz=KST)
+    embed.add_field(
+        name="⏰ 발행시간",
+        value=dt.strftime("%Y-%m-%d %H:%M:%S"),
+        inline=False
+    )
+
+    return embed
+
+
+def render_news_page_embed(article: Dict[str, Any]) -> discord.Embed:
+    """/뉴스확인 페이지용 뉴스 임베드를 만든다. (제목, 썸네일, 한국식 발행시간)"""
+    embed = discord.Embed(
+        title=article.get('title'),
+        url=article.get('linkUrl'),
+        color=0x1E90FF
+    )
+    if article.get('thumbnail'):
+        embed.set_thumbnail(url=article['thumbnail'])
+
+    ts = article.get('createdAt')
+    if ts:
+        # 한국식 시간 포맷
+        dt_kst = datetime.fromtimestamp(ts / 1000, tz=KST)
+        hour = dt_kst.hour
+        minute = dt_kst.minute
+        ampm = "오전" if hour < 12 else "오후"
+        hour12 = hour if 1 <= hour <= 12 else (hour - 12 if hour > 12 else 12)
+        formatted = f"{dt_kst.strftime('%Y-%m-%d')} {ampm} {hour12}:{minute:02d}"
+    else:
+        formatted = "-"
+    embed.add_field(
+        name="⏰ 발행시간",
+        value=formatted,
+        inline=False
+    )
+    return embed
+
+
+class EmbedCache:
+    """
+    기사 식별자별로 완성된 임베드를 보관하는 렌더 캐시.
+    한 사이클의 모든 채널과 NewsView의 모든 페이지가 같은 임베드 객체를 재사용하며,
+    발행 후 retention_hours가 지난 기사는 evict()에서 제거된다.
+    """
+
+    def __init__(self, retention_hours: float = 48, max_size: int = 2000):
+        self.retention_ms = int(retention_hours * 3600 * 1000)
+        self.max_size = max_size
+        self.entries: Dict[Tuple[str, str], Tuple[int, discord.Embed]] = {}
+
+    def get(self, kind: str, article: Dict[str, Any], render: Callable[[Dict[str, Any]], discord.Embed]) -> discord.Embed:
+        """
+        캐시된 임베드를 반환한다. 없으면 render로 한 번만 만들어 저장한다.
+
+        Args:
+            kind (str): 임베드 종류 (예: "news", "page")
+            article (Dict): 기사 dict
+            render (Callable): 캐시에 없을 때 임베드를 만드는 함수
+
+        Returns:
+            discord.Embed: 렌더링된 임베드 (공유 객체이므로 수정하지 말 것)
+        """
+        key = (kind, article_key(article))
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = (article.get("createdAt") or 0, render(article))
+            self.entries[key] = entry
+            if len(self.entries) > self.max_size:
+                self.evict()
+        return entry[1]
+
+    def evict(self, now_ms: int = None) -> int:
+        """
+        보관 기간이 지난 기사의 임베드를 제거한다. 그래도 max_size를 넘으면 오래된 기사부터 제거한다.
+
+        Returns:
+            int: 제거한 항목 수
+        """
+        now_ms = now_ms or int(time.time() * 1000)
+        cutoff = now_ms - self.retention_ms
+        expired = [key for key, (created_at, _) in self.entries.items() if created_at < cutoff]
+
+        overflow = len(self.entries) - len(expired) - self.max_size
+        if overflow > 0:
+            alive = sorted(
+                (item for item in self.entries.items() if item[1][0] >= cutoff),
+                key=lambda item: item[1][0]
+            )
+            expired.extend(key for key, _ in alive[:overflow])
+
+        for key in expired:
+            del self.entries[key]
+        return len(expired)
+
+
+# 뉴스 루프와 NewsView가 함께 사용하는 임베드 캐시
+news_embed_cache = EmbedCache()
@@ -0,0 +1,187 @@
+import time
+import asyncio
+import discord
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Discord 메시지 한 건에 담을 수 있는 최대 임베드 수 / 임베드 전체 글자 수
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+def batch_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """
+    임베드 목록을 Discord 제한(메시지당 10개, 전체 6000자) 안에서 최대한 묶는다.
+    순서는 그대로 유지한다.
+
+    Args:
+        embeds (List[discord.Embed]): 전송할 임베드 목록
+
+    Returns:
+        List[List[discord.Embed]]: 메시지 한 건씩에 담을 임베드 묶음 목록
+    """
+    batches: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    current_chars = 0
+
+    for embed in embeds:
+        embed_chars = len(embed)
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or current_chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(embed)
+        current_chars += embed_chars
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+class RateBucket:
+    """
+    토큰 버킷 방식의 전송 속도 제한기.
+    period초 동안 최대 limit번의 요청을 허용하며, 429 응답을 받으면 retry_after 동안 버킷을 막는다.
+    """
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self.tokens = float(limit)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.limit, self.tokens + elapsed * self.limit / self.period)
+        self.updated_at = now
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기한다. (대기자는 도착 순서대로 처리)"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) * self.period / self.limit)
+
+    def block(self, retry_after: float):
+        """Discord가 지정한 retry_after 동안 버킷을 막는다."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+        self.tokens = 0
+
+
+class NewsFanout:
+    """
+    뉴스 메시지를 여러 채널에 동시에 전송하는 전송 엔진.
+    고정 sleep 대신 Discord의 전역 버킷(봇 전체)과 채널별 메시지 버킷으로 속도를 조절한다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 50,
+        global_limit: int = 45,
+        global_period: float = 1.0,
+        channel_limit: int = 5,
+        channel_period: float = 5.0,
+        max_attempts: int = 3,
+    ):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.global_bucket = RateBucket(global_limit, global_period)
+        self.channel_limit = channel_limit
+        self.channel_period = channel_period
+        self.channel_buckets: Dict[int, RateBucket] = {}
+        self.max_attempts = max_attempts
+
+    def channel_bucket(self, channel_id: int) -> RateBucket:
+        """채널별 메시지 전송 버킷을 반환한다. (없으면 생성)"""
+        bucket = self.channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = RateBucket(self.channel_limit, self.channel_period)
+            self.channel_buckets[channel_id] = bucket
+        return bucket
+
+    async def deliver(
+        self,
+        jobs: List[Tuple[discord.abc.Messageable, List[Dict[str, Any]]]],
+        on_sent: Optional[Callable[[discord.abc.Messageable, int], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        채널별 메시지 목록을 동시에 전송한다. 한 채널 안에서는 메시지 순서를 유지한다.
+
+        Args:
+            jobs: (채널, channel.send에 전달할 kwargs 목록) 튜플 리스트
+            on_sent: 메시지 전송에 성공할 때마다 (채널, 메시지 인덱스)로 호출되는 콜백 (전송 기록용)
+
+        Returns:
+            dict: 전송 결과 리포트 (channels, sent, failed, elapsed)
+        """
+        report = {"channels": len(jobs), "sent": 0, "failed": 0, "elapsed": 0.0}
+        started = time.perf_counter()
+
+        await asyncio.gather(*(
+            self._deliver_channel(channel, messages, report, on_sent)
+            for channel, messages in jobs
+        ))
+
+        report["elapsed"] = time.perf_counter() - started
+        return report
+
+    async def _deliver_channel(self, channel: discord.abc.Messageable, messages: List[Dict[str, Any]], report: Dict[str, Any], on_sent=None):
+        async with self.semaphore:
+            bucket = self.channel_bucket(channel.id)
+            for i, kwargs in enumerate(messages):
+                try:
+                    sent = await self._send(channel, bucket, kwargs)
+                except (discord.Forbidden, discord.NotFound) as e:
+                    # 권한이 없거나 삭제된 채널이면 남은 메시지도 보낼 수 없음
+                    print(f"❌ 채널 {channel.id} 전송 중단: {e}")
+                    report["failed"] += len(messages) - i
+                    return
+                except Exception as e:
+                    # 네트워크 오류 등은 이 메시지만 실패로 처리 (다른 채널/메시지 전송은 계속)
+                    print(f"❌ 채널 {channel.id} 메시지 전송 실패: {e!r}")
+                    report["failed"] += 1
+                    continue
+
+                if not sent:
+                    report["failed"] += 1
+                    continue
+                report["sent"] += 1
+                if on_sent is not None:
+                    try:
+                        await on_sent(channel, i)
+                    except Exception as e:
+                        # 메시지는 이미 전송됨 → 기록 실패만 로그로 남기고 계속
+                        print(f"⚠️ 채널 {channel.id} 전송 기록 실패: {e!r}")
+
+    async def _send(self, channel: discord.abc.Messageable, bucket: RateBucket, kwargs: Dict[str, Any]) -> bool:
+        for attempt in range(self.max_attempts):
+            await bucket.acquire()
+            await self.global_bucket.acquire()
+            try:
+                await channel.send(**kwargs)
+                return True
+            except (discord.Forbidden, discord.NotFound):
+                raise
+            except discord.HTTPException as e:
+                if e.status != 429:
+                    print(f"❌ 채널 {channel.id} 메시지 전송 실패: {e}")
+                    return False
+
+                headers = e.response.headers
+                retry_after = float(headers.get("Retry-After", 1))
+                if headers.get("X-RateLimit-Global"):
+                    self.global_bucket.block(retry_after)
+                else:
+                    bucket.block(retry_after)
+                print(f"⏰ 채널 {channel.id} Rate Limit: {retry_after}초 후 재시도 ({attempt + 1}/{self.max_attempts})")
+
+        return False
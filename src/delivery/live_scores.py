@@ -0,0 +1,104 @@
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+
+def match_key(match: Dict[str, Any]) -> Hashable:
+    """경기 식별 key (matchId가 없으면 팀 이름 + 시작 시각)"""
+    return match.get("matchId") or (match.get("team1"), match.get("team2"), match.get("startDate"))
+
+
+def score_state(matches: List[Dict[str, Any]]) -> Tuple:
+    """메시지에 표시된 경기들의 (상태, 점수1, 점수2) 목록. 이 값이 바뀔 때만 메시지를 수정한다."""
+    return tuple((m.get("status"), m.get("score1"), m.get("score2")) for m in matches)
+
+
+class LiveScoreTracker:
+    """
+    진행 중인 경기가 담긴 일정 메시지를 추적해, 점수/상태가 바뀐 메시지만 골라내는 추적기.
+
+    - track()으로 보낸 메시지와 표시한 경기 목록을 등록한다. (진행 중인 경기가 없으면 등록하지 않음)
+    - changes()에 리그의 최신 일정을 넘기면, 이전과 점수/상태가 달라진 메시지와 갱신된 경기 목록을 반환한다.
+    - 진행 중인 경기가 모두 끝났거나 max_age초가 지난 메시지는 추적을 멈춘다.
+    메시지 전송/수정은 호출 측(ScheduleCommand)이 담당한다.
+    """
+
+    def __init__(self, max_messages: int = 200, max_age: float = 6 * 3600):
+        self.max_messages = max_messages
+        self.max_age = max_age
+        # message id → {"message", "league", "matches", "scores", "tracked_at"}
+        self.entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"tracked": 0, "polled": 0, "edited": 0}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def track(self, league: Tuple[str, str], message: Any, matches: List[Dict[str, Any]]) -> bool:
+        """
+        일정 메시지를 추적 대상으로 등록한다.
+
+        Args:
+            league (Tuple[str, str]): (게임, 리그 코드) — 일정 캐시 key와 같음
+            message (discord.Message): 수정할 메시지
+            matches (List[Dict]): 메시지에 표시한 경기 목록 (표시 순서)
+
+        Returns:
+            bool: 등록 여부 (진행 중인 경기가 없으면 False)
+        """
+        if not any(m.get("status") == "STARTED" for m in matches):
+            return False
+
+        self.entries[message.id] = {
+            "message": message,
+            "league": league,
+            "matches": list(matches),
+            "scores": score_state(matches),
+            "tracked_at": time.monotonic(),
+        }
+        self.entries.move_to_end(message.id)
+        while len(self.entries) > self.max_messages:
+            self.entries.popitem(last=False)
+        self.stats["tracked"] += 1
+        return True
+
+    def untrack(self, message_id: int) -> None:
+        self.entries.pop(message_id, None)
+
+    def leagues(self) -> Set[Tuple[str, str]]:
+        """추적 중인 메시지가 있는 리그 목록 (이 리그들만 폴링하면 됨). 오래된 메시지는 여기서 정리한다."""
+        cutoff = time.monotonic() - self.max_age
+        for message_id in [mid for mid, entry in self.entries.items() if entry["tracked_at"] < cutoff]:
+            del self.entries[message_id]
+        return {entry["league"] for entry in self.entries.values()}
+
+    def changes(self, league: Tuple[str, str], fresh_matches: List[Dict[str, Any]]) -> List[Tuple[Any, List[Dict[str, Any]]]]:
+        """
+        리그의 최신 일정과 비교해 점수/상태가 바뀐 메시지를 반환한다.
+
+        Args:
+            league (Tuple[str, str]): (게임, 리그 코드)
+            fresh_matches (List[Dict]): 방금 가져온 리그 일정 (최신 일정에 없는 경기는 이전 값을 유지)
+
+        Returns:
+            List[Tuple[discord.Message, List[Dict]]]: (수정할 메시지, 갱신된 경기 목록)
+        """
+        fresh = {match_key(m): m for m in fresh_matches or []}
+        changed = []
+        for message_id, entry in list(self.entries.items()):
+            if entry["league"] != league:
+                continue
+            self.stats["polled"] += 1
+
+            matches = [fresh.get(match_key(m), m) for m in entry["matches"]]
+            scores = score_state(matches)
+            if scores != entry["scores"]:
+                entry["matches"] = matches
+                entry["scores"] = scores
+                changed.append((entry["message"], matches))
+                self.stats["edited"] += 1
+
+            # 진행 중인 경기가 모두 끝나면 (마지막 수정 후) 추적 종료
+            if not any(m.get("status") == "STARTED" for m in matches):
+                del self.entries[message_id]
+        return changed
@@ -0,0 +1,88 @@
+import heapq
+
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+# 구독 조합 튜플의 게임 순서
+GAMES = ("lol", "valorant", "overwatch")
+
+Combo = Tuple[bool, bool, bool]
+
+
+def subscription_combo(state: Dict[str, bool]) -> Combo:
+    """채널 설정값에서 (lol, valorant, overwatch) 구독 조합 튜플을 만든다."""
+    return tuple(bool(state.get(game, False)) for game in GAMES)
+
+
+class SubscriptionIndex:
+    """
+    채널을 (lol, valorant, overwatch) 구독 조합별로 묶어 두는 인메모리 인덱스.
+    게임이 3개이므로 조합은 최대 7개이고, 기사 병합은 채널 수가 아니라 조합 수만큼만 수행한다.
+    """
+
+    def __init__(self, channel_states: Dict[int, Dict[str, bool]] = None):
+        self.states: Dict[int, Dict[str, bool]] = {}
+        self.groups: Dict[Combo, Set[int]] = {}
+        if channel_states:
+            self.rebuild(channel_states)
+
+    def rebuild(self, channel_states: Dict[int, Dict[str, bool]]):
+        """전체 채널 설정값으로 인덱스를 다시 만든다."""
+        self.states = {}
+        self.groups = {}
+        for channel_id, state in channel_states.items():
+            self.update(channel_id, state)
+
+    def update(self, channel_id: int, state: Dict[str, bool]):
+        """채널 하나의 설정값을 추가하거나 갱신한다."""
+        self.remove(channel_id)
+        combo = subscription_combo(state)
+        self.states[channel_id] = state
+        if any(combo):
+            self.groups.setdefault(combo, set()).add(channel_id)
+
+    def remove(self, channel_id: int):
+        """채널 하나를 인덱스에서 제거한다."""
+        state = self.states.pop(channel_id, None)
+        if state is None:
+            return
+        combo = subscription_combo(state)
+        channels = self.groups.get(combo)
+        if channels is not None:
+            channels.discard(channel_id)
+            if not channels:
+                del self.groups[combo]
+
+    def subscriber_count(self, game: str) -> int:
+        """해당 게임을 구독 중인 채널 수를 반환한다."""
+        index = GAMES.index(game)
+        return sum(len(channels) for combo, channels in self.groups.items() if combo[index])
+
+    def merged_articles(self, articles_by_game: Dict[str, List[Dict[str, Any]]]) -> Dict[Combo, List[Dict[str, Any]]]:
+        """
+        구독 조합별로 createdAt 오름차순으로 병합된 기사 목록을 만든다.
+        게임별 목록을 한 번씩 정렬한 뒤 조합마다 k-way merge(heapq.merge)로 합친다.
+
+        Args:
+            articles_by_game (Dict): 게임 key별 신규 기사 목록
+
+        Returns:
+            Dict: 구독 조합 → 병합된 기사 목록 (기사가 없는 조합은 제외)
+        """
+        sorted_by_game = {
+            game: sorted(articles_by_game.get(game, []), key=lambda x: x['createdAt'])
+            for game in GAMES
+        }
+
+        merged = {}
+        for combo in self.groups:
+            articles = list(heapq.merge(
+                *(sorted_by_game[game] for game, subscribed in zip(GAMES, combo) if subscribed),
+                key=lambda x: x['createdAt']
+            ))
+            if articles:
+                merged[combo] = articles
+        return merged
+
+    def channels(self, combo: Combo) -> Iterable[int]:
+        """해당 구독 조합에 속한 채널 ID 목록을 반환한다."""
+        return self.groups.get(combo, ())
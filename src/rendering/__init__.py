@@ -0,0 +1,30 @@
+# 팀 로고 캐시
+from .logo_cache import IMAGE_HEADERS, LOGO_SIZE, LogoCache, team_logo_cache
+
+# 스코어보드 렌더링 / 렌더 캐시
+from .scoreboard import (
+    ScoreboardCache, format_score, load_score_font, render_schedule_sheet, schedule_sheet_cache
+)
+
+# 스코어보드 렌더링 파이프라인
+from .pipeline import build_schedule_sheet, render_executor, scoreboard_key
+
+__all__ = [
+    # 팀 로고 캐시
+    "IMAGE_HEADERS",
+    "LOGO_SIZE",
+    "LogoCache",
+    "team_logo_cache",
+
+    # 스코어보드 렌더링 / 렌더 캐시
+    "ScoreboardCache",
+    "format_score",
+    "load_score_font",
+    "render_schedule_sheet",
+    "schedule_sheet_cache",
+
+    # 스코어보드 렌더링 파이프라인
+    "build_schedule_sheet",
+    "render_executor",
+    "scoreboard_key",
+]
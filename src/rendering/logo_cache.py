@@ -0,0 +1,155 @@
+import io
+import os
+import asyncio
+import hashlib
+import aiohttp
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from PIL import Image
+
+# 팀 로고 이미지 요청용 헤더
+IMAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Whale/4.32.315.22 Safari/537.36",
+    "Accept": "image/avif,image/webp,image/*,*/*;q=0.8"
+}
+
+# 스코어보드에 그리는 로고 크기
+LOGO_SIZE = (70, 70)
+
+# 디스크 캐시 위치 (재시작 후에도 유지)
+LOGO_CACHE_DIR = Path(os.getenv("LOGO_CACHE_DIR", Path.home() / ".cache" / "rgl-news-bot" / "logos"))
+
+
+def _decode_logo(data: bytes, size: Tuple[int, int]) -> Image.Image:
+    """이미지 바이트를 RGBA로 디코딩하고 size 안에 맞게 줄인다."""
+    img = Image.open(io.BytesIO(data)).convert("RGBA")
+    img.thumbnail(size, Image.LANCZOS)
+    return img
+
+
+class LogoCache:
+    """
+    팀 로고 캐시 (URL → 디코딩/리사이즈가 끝난 70×70 RGBA 이미지).
+
+    - 메모리: 최근에 쓴 순서로 max_items개까지 보관 (LRU)
+    - 디스크: cache_dir에 리사이즈된 PNG로 저장해 재시작 후에도 다시 다운로드하지 않음
+    - 같은 URL을 동시에 요청하면 다운로드는 한 번만 수행
+    반환된 이미지는 여러 스코어보드가 공유하므로 수정하지 말 것 (paste의 원본으로만 사용)
+    """
+
+    def __init__(self, max_items: int = 256, size: Tuple[int, int] = LOGO_SIZE, cache_dir: Optional[Path] = LOGO_CACHE_DIR, max_attempts: int = 3):
+        self.max_items = max_items
+        self.size = size
+        self.cache_dir = cache_dir
+        self.max_attempts = max_attempts
+        self.images: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"memory": 0, "disk": 0, "download": 0}
+
+    def peek(self, url: str) -> Optional[Image.Image]:
+        """메모리에 있는 로고만 반환한다. (없으면 None)"""
+        img = self.images.get(url)
+        if img is not None:
+            self.images.move_to_end(url)
+        return img
+
+    def _put(self, url: str, img: Image.Image):
+        self.images[url] = img
+        self.images.move_to_end(url)
+        while len(self.images) > self.max_items:
+            self.images.popitem(last=False)
+
+    def _disk_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}_{self.size[0]}x{self.size[1]}.png"
+
+    def _read_disk(self, url: str) -> Optional[Image.Image]:
+        path = self._disk_path(url)
+        try:
+            with Image.open(path) as img:
+                return img.convert("RGBA")
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, url: str, img: Image.Image):
+        path = self._disk_path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            img.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ 로고 디스크 캐시 저장 실패: {e}")
+
+    async def _download(self, url: str, session: aiohttp.ClientSession) -> Image.Image:
+        for attempt in range(self.max_attempts):
+            try:
+                await asyncio.sleep(0.3 * attempt)
+                async with session.get(url, headers=IMAGE_HEADERS) as resp:
+                    if resp.status != 200:
+                        raise ValueError(f"HTTP {resp.status}")
+                    data = await resp.read()
+                return await asyncio.to_thread(_decode_logo, data, self.size)
+            except Exception as e:
+                if attempt == self.max_attempts - 1:
+                    raise
+                print(f"이미지 다운로드 재시도 {attempt + 1}/{self.max_attempts}: {e}")
+
+    async def _load(self, url: str, session: aiohttp.ClientSession) -> Image.Image:
+        if self.cache_dir is not None:
+            img = await asyncio.to_thread(self._read_disk, url)
+            if img is not None:
+                self.stats["disk"] += 1
+                return img
+
+        img = await self._download(url, session)
+        self.stats["download"] += 1
+        if self.cache_dir is not None:
+            await asyncio.to_thread(self._write_disk, url, img)
+        return img
+
+    async def get(self, url: str, session: aiohttp.ClientSession) -> Image.Image:
+        """
+        로고 이미지를 반환한다. 메모리 → 디스크 → 다운로드 순으로 찾는다.
+
+        Args:
+            url (str): 로고 이미지 URL
+            session (aiohttp.ClientSession): 다운로드에 사용할 세션
+
+        Returns:
+            Image.Image: size 안으로 줄인 RGBA 이미지
+
+        Raises:
+            Exception: 다운로드가 max_attempts번 모두 실패한 경우
+        """
+        img = self.peek(url)
+        if img is not None:
+            self.stats["memory"] += 1
+            return img
+
+        future = self.inflight.get(url)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[url] = future
+        try:
+            img = await self._load(url, session)
+            self._put(url, img)
+            future.set_result(img)
+            return img
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 쪽이 없어도 "exception was never retrieved" 경고가 나지 않게 함
+            future.exception()
+            raise
+        finally:
+            del self.inflight[url]
+
+
+# 스코어보드 렌더링이 함께 사용하는 팀 로고 캐시
+team_logo_cache = LogoCache()
@@ -0,0 +1,57 @@
+import os
+import asyncio
+import aiohttp
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from PIL import ImageFont
+
+from .logo_cache import team_logo_cache
+from .scoreboard import format_score, render_schedule_sheet, schedule_sheet_cache
+
+# 일정 시트 렌더링 전용 스레드 풀 (PIL 합성/PNG 인코딩을 이벤트 루프 밖에서 실행)
+render_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="scoreboard")
+
+
+def scoreboard_key(match: Dict[str, Any]) -> tuple:
+    """경기의 스코어보드 렌더 캐시 key (로고1 URL, 로고2 URL, 점수 문자열)"""
+    return (match.get("team1Img") or "", match.get("team2Img") or "", format_score(match.get("score1"), match.get("score2")))
+
+
+async def build_schedule_sheet(matches: List[Dict[str, Any]], session: aiohttp.ClientSession, font: ImageFont.ImageFont) -> Optional[bytes]:
+    """
+    여러 경기의 스코어보드를 한 장으로 이어 붙인 일정 시트 PNG를 만든다.
+    모든 로고를 동시에 가져오고, 가져오지 못한 로고는 빈칸으로 그린다. 같은 경기/점수 구성이면 시트 캐시를 재사용한다.
+
+    Args:
+        matches (List[Dict]): 경기 dict 목록 (표시 순서)
+        session (aiohttp.ClientSession): 로고 다운로드에 사용할 세션
+        font (ImageFont.ImageFont): 점수 폰트
+
+    Returns:
+        Optional[bytes]: PNG 바이트 (경기가 없으면 None)
+    """
+    if not matches:
+        return None
+
+    keys = [scoreboard_key(match) for match in matches]
+    sheet_key = tuple(keys)
+    data = schedule_sheet_cache.get(sheet_key)
+    if data is not None:
+        return data
+
+    urls = list({url for key in keys for url in key[:2] if url})
+    results = await asyncio.gather(*(team_logo_cache.get(url, session) for url in urls), return_exceptions=True)
+    logos = {}
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            print(f"로고 다운로드 실패: {url} ({result})")
+        else:
+            logos[url] = result
+
+    rows = [(logos.get(url1), logos.get(url2), score_text) for url1, url2, score_text in keys]
+    data = await asyncio.get_running_loop().run_in_executor(render_executor, render_schedule_sheet, rows, font)
+    # 로고가 빠진 시트는 캐시하지 않아 다음 요청에서 다시 시도
+    if len(logos) == len(urls):
+        schedule_sheet_cache.put(sheet_key, data)
+    return data
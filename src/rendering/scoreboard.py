@@ -0,0 +1,107 @@
+import io
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+# 스코어보드 캔버스 크기
+SCOREBOARD_SIZE = (460, 90)
+
+# 일정 시트에서 경기(스코어보드) 사이 간격
+SHEET_ROW_GAP = 8
+
+# 점수 폰트 후보 (앞에서부터 시도)
+FONT_PATHS = [
+    "DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
+    "/System/Library/Fonts/Arial.ttf",  # macOS
+    "C:/Windows/Fonts/arial.ttf",  # Windows
+    "/usr/share/fonts/TTF/arial.ttf",  # Some Linux distributions
+]
+
+ScoreboardKey = Tuple[str, str, str]
+
+
+def load_score_font(size: int = 32) -> ImageFont.ImageFont:
+    """FONT_PATHS에서 처음으로 열리는 폰트를 반환한다. 모두 실패하면 PIL 기본 폰트를 사용한다."""
+    for font_path in FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def format_score(score1, score2) -> str:
+    """스코어보드에 그릴 점수 문자열을 만든다. (경기 전이면 "- : -")"""
+    if score1 is None and score2 is None:
+        return "- : -"
+    left_score = 0 if score1 is None else score1
+    right_score = 0 if score2 is None else score2
+    return f"{left_score} : {right_score}"
+
+
+def _draw_scoreboard(canvas: Image.Image, top: int, img1: Optional[Image.Image], img2: Optional[Image.Image], score_text: str, font: ImageFont.ImageFont):
+    """canvas의 top 위치에 스코어보드 한 줄(SCOREBOARD_SIZE)을 그린다. 로고가 None이면 비워 둔다."""
+    W, H = SCOREBOARD_SIZE
+    draw = ImageDraw.Draw(canvas)
+
+    if img1 is not None:
+        canvas.paste(img1, (10, top + (H - img1.height)//2), img1)
+    if img2 is not None:
+        canvas.paste(img2, (W - img2.width - 10, top + (H - img2.height)//2), img2)
+
+    bbox = draw.textbbox((0, 0), score_text, font=font)
+    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+    draw.text(((W - tw)//2, top + (H - th)//2), score_text, fill="white", font=font, stroke_width=2, stroke_fill="black")
+
+
+def _encode_png(canvas: Image.Image) -> bytes:
+    buf = io.BytesIO()
+    canvas.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def render_schedule_sheet(rows: List[Tuple[Optional[Image.Image], Optional[Image.Image], str]], font: ImageFont.ImageFont) -> bytes:
+    """
+    여러 경기의 스코어보드를 세로로 이어 붙인 한 장의 PNG를 만든다. (경기 순서 = 위에서 아래)
+
+    Args:
+        rows: 경기별 (왼쪽 로고, 오른쪽 로고, 점수 문자열). 로고를 가져오지 못한 칸은 None
+        font: 점수 폰트
+
+    Returns:
+        bytes: PNG 이미지 바이트
+    """
+    W, H = SCOREBOARD_SIZE
+    canvas = Image.new("RGBA", (W, H * len(rows) + SHEET_ROW_GAP * (len(rows) - 1)), (255, 255, 255, 0))
+    for i, (img1, img2, score_text) in enumerate(rows):
+        _draw_scoreboard(canvas, i * (H + SHEET_ROW_GAP), img1, img2, score_text, font)
+    return _encode_png(canvas)
+
+
+class ScoreboardCache:
+    """
+    완성된 일정 시트 PNG 바이트 캐시. 경기별 (로고1 URL, 로고2 URL, 점수 문자열) key의 튜플 → PNG bytes
+    같은 경기 목록/점수를 다시 요청하면 PIL 작업 없이 바이트를 그대로 재사용한다. (LRU, max_items개)
+    """
+
+    def __init__(self, max_items: int = 256):
+        self.max_items = max_items
+        self.entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+    def get(self, key) -> Optional[bytes]:
+        data = self.entries.get(key)
+        if data is not None:
+            self.entries.move_to_end(key)
+        return data
+
+    def put(self, key, data: bytes):
+        self.entries[key] = data
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_items:
+            self.entries.popitem(last=False)
+
+
+# 일정 시트 렌더 캐시 (경기별 스코어보드 key 튜플 → PNG bytes)
+schedule_sheet_cache = ScoreboardCache(max_items=64)